@@ -1,12 +1,167 @@
 import numpy as np
-from scipy.integrate import odeint  
-import matplotlib.pyplot as plt 
+from scipy.integrate import odeint
+import matplotlib
+matplotlib.use('Agg') # headless -- everything goes to files, so skip the GUI backend probe
+import matplotlib.pyplot as plt
 import math
+import os
+import functools
 import seaborn as sb
-import multiprocessing as mp 
+import multiprocessing as mp
 from joblib import Parallel, delayed
 from matplotlib.colors import ListedColormap
 
+# numba is optional -- if it's installed the ODE right-hand sides below get JIT-compiled,
+# otherwise the same functions run as plain python/numpy (slower but identical results)
+try:
+	from numba import njit
+	HAVE_NUMBA = True
+except ImportError:
+	HAVE_NUMBA = False
+	def njit(*args, **kwargs):
+		if len(args) == 1 and callable(args[0]):
+			return args[0]
+		def wrap(func):
+			return func
+		return wrap
+
+# integer codes for the management strategies so the compiled signal function
+# doesn't have to compare strings inside the solver loop
+MGMT_CODES = {'periodic': 0, 'MPA': 1}
+
+# overlaying the swept growth rate on a template only ever produces a handful of
+# distinct dicts, so build each combination once; the values are plain scalars and
+# callers only read from the dict, so sharing it across Model instances is safe
+@functools.lru_cache(maxsize = None)
+def load_params_cached(model_type, fish_growth_rate):
+	params = dict(PARAM_TEMPLATES[model_type])
+	params['rH' if model_type == 'RB' else 's'] = fish_growth_rate
+	return params
+
+
+# shared integration grids, built once at import. One point per year (linspace(0,
+# yrs, yrs) -- so dt is yrs/(yrs-1), close to but not exactly 1) because the signal
+# tables and end-of-run averages index these grids by year. RB equilibrates far more
+# slowly than the other models, hence its much longer grid.
+T_DEFAULT = np.linspace(0, 500, 500)
+T_RB = np.linspace(0, 12000, 12000)
+
+# one dispersal matrix per (n, dispersal fraction) -- the clones main() creates at
+# different stay values share these instead of each building its own n x n array.
+# Frozen so a shared matrix can't be edited through one model behind the others' backs
+@functools.lru_cache(maxsize = None)
+def dispersal_matrix(n, frac_dispersed):
+	kP = np.full((n, n), frac_dispersed, dtype = np.float64)
+	np.fill_diagonal(kP, -frac_dispersed*(n - 1))
+	kP = np.ascontiguousarray(kP) # C-contiguous float64 so the jitted RHS gets a fast path
+	kP.flags.writeable = False
+	return kP
+
+
+# odd grid lengths (the crt-scaled RB runs) are memoized too, so repeated scenario
+# tasks with the same horizon share one array instead of rebuilding it per call
+@functools.lru_cache(maxsize = None)
+def time_grid(yrs):
+	if yrs == 500:
+		return T_DEFAULT
+	if yrs == 12000:
+		return T_RB
+	return np.linspace(0, yrs, yrs)
+
+# fixed parameter values per model -- the fish growth rate (s, or rH for RB) is the
+# one knob the scenarios sweep, so load_parameters overlays it on top of these
+PARAM_TEMPLATES = {
+	'vdL': {
+		"r": 0.3,
+		"i_C" : 0.05,
+		"i_M" : 0.05,
+		"ext_C" : 0.0001,
+		"ext_P" : 0.0001,
+		"gamma" : 0.8,
+		"d" : 0.1,
+		"g" : 1,
+		"sigma" : .5, #strength of coral-herbivore feedback
+		"eta" : 2, #strength of algae-herbivore feedback
+		"alpha" : 0.5, #strength of algae-coral feedback 
+		"P0" : 0.1, # why are these here? try commenting out to see if breaks anything - dec 5 
+		"C_HI" : .4,
+		"M_LO" : .04,
+		"C_LO" : .04,
+		"M_HI" : .4
+	},
+	'vdL_MC': {
+		"r": 0.3,
+		"i_C" : 0.05,
+		"i_M" : 0.05,
+		"ext_C" : 0.0001,
+		"ext_P" : 0.0001,
+		"gamma" : 0.8,
+		"d" : 0.1,
+		"g" : 1,
+		"sigma" : 0, #strength of coral-herbivore feedback
+		"eta" : 0, #strength of algae-herbivore feedback
+		"alpha" : 2 #strength of algae-coral feedback 
+	},
+	'vdL_MP': {
+		"r": 0.3,
+		"i_C" : 0.05,
+		"i_M" : 0.05,
+		"ext_C" : 0.0001,
+		"ext_P" : 0.0001,
+		"gamma" : 0.8,
+		"d" : 0.1,
+		"g" : 1,
+		"sigma" : 0, #strength of coral-herbivore feedback
+		"eta" : 4, #strength of algae-herbivore feedback
+		"alpha" : 0 #strength of algae-coral feedback 
+	},
+	'vdL_PC': {
+		"r": 0.3,
+		"i_C" : 0.05,
+		"i_M" : 0.05,
+		"ext_C" : 0.0001,
+		"ext_P" : 0.0001,
+		"gamma" : 0.8,
+		"d" : 0.1,
+		"g" : 1,
+		"sigma" : .9, #strength of coral-herbivore feedback
+		"eta" : 0, #strength of algae-herbivore feedback
+		"alpha" : 0, #strength of algae-coral feedback 
+	},
+	'BM': {
+		"gamma" : 0.8,
+		"beta" : 1,
+		"alpha" : 1,
+		"r" : 1,
+		"d" : 0.44,
+		"a" : 0.1,
+		"i_C" : 0.05,
+		"i_M" : 0.05
+	},
+	'RB': {
+		"phiC" : 0.001, #open recruitment of coral
+		"phiM" : 0.0001, #open recruitment of macroalgae
+
+		"rM" : 0.5, #production of vulnerable macroalgae from invulnerable stage"
+
+		#growth rates
+		"gTC" : 0.1, #combined rate of growth and local recruitment of corals over free space 
+		"gTV" : 0.2, #growth rate of vulnerable macroalgae over free space 
+		"gTI" : 0.4, #growth rate of invulnerable macroalgae over free space 
+
+		"gamma" : 0.4, #growth of macroalgae over coral vs free space
+		"omega" : 2, #maturation rate of macroalgae from vulnerable to invulnerable class "
+
+		#death rates
+		"dC" : 0.05, #death rate of coral 
+		"dI" : 0.4, #death rate of invulnerable macroalgae
+		"dV" : 0.4, #death rate of vulnerable macroalgae per unit biomass of herbivores "
+
+		"K" : 20, 
+		"Graze" : 0.58
+	},
+}
+
 
 ####### To install libraries ###############
 # pip install [library name] in terminal
@@ -41,17 +196,33 @@ feel free to reach out to me with questions (leemonroe20@gmail.com)
 class Model:
 	
 	# constructor for Model object
-	def __init__(self, model_type, n, frac_nomove, mgmt_strat = 'periodic'): 
+	def __init__(self, model_type, n, frac_nomove, mgmt_strat = 'periodic'):
 		self.model_type = model_type
-		self.n = n 
+		self.n = n
 		self.frac_nomove = frac_nomove
-		self.mgmt_strat = mgmt_strat 
+		self.mgmt_strat = mgmt_strat
+		self.debug = False # set True for per-run progress chatter (very slow on heatmaps)
+
+		# resolve the RHS and Jacobian once here instead of a dict lookup on every
+		# solver step
+		self._rhs = RHS_FUNCS.get(model_type)
+		if self._rhs is None:
+			print("Bad input, defaulting to Blackwood-Mumby!")
+			self._rhs = blackwood_rhs
+		self._jac = JAC_FUNCS.get(model_type)
 
 		self.f = 0
 		self.closure_length = 0
-		self.m = 0 
+		self.m = 0
 		self.poaching = 0
 
+		# scratch buffer the RHS writes derivatives into (4 states per patch for RB, 3 otherwise)
+		self._dY = np.empty(4*n if model_type == 'RB' else 3*n)
+
+		self._signal_tables = {} # cached square_signal lookup tables, see get_signal_table
+		self._params = None # cached pack_params tuple, rebuilt when parameters change
+		self._crt_cache = {} # cached coral recovery times keyed by time grid, see get_coral_recovery_time
+
 
 	# initialize model (van de Leemput and Blackwood-Mumby)
 	def initialize_patch_model(self, P0, C0L, C0H, M0L, M0H, M0iL = None, M0iH = None):
@@ -63,23 +234,24 @@ class Model:
 
 		frac_dispersed = (1-self.frac_nomove)*(1/(self.n)) # fraction of fish that disperse to other patches symmetrically
 
-		kP = np.empty((self.n,self.n)) 
-		for i in range(self.n):
-			for j in range(self.n):
-				kP[i][j] = frac_dispersed
-				if i == j:
-					kP[i][j] = -frac_dispersed*(self.n - 1)
-		setattr(self,'kP', kP)
+		self.kP = dispersal_matrix(self.n, frac_dispersed) # shared across models, read-only
+		# kP has only two distinct entries, so kP @ P collapses to
+		# frac_dispersed * (P.sum() - n*P) -- the RHS uses this instead of a matmul
+		self._alpha = frac_dispersed
+		self._params = None
+
 
-		
 		setattr(self, 'P', np.zeros(self.n))
 		setattr(self, 'C' , np.empty(self.n))
 		setattr(self,'M', np.empty(self.n))
-		setattr(self,'dPs', np.empty(self.n))
-		setattr(self,'dCs', np.empty(self.n))
-		setattr(self,'dMs', np.empty(self.n))
-		setattr(self, 'X1', [P0]*self.n + [C0L]*self.n + [M0H]*self.n)
-		setattr(self, 'X2', [P0]*self.n + [C0H]*self.n + [M0L]*self.n)  
+		# contiguous float64 arrays so odeint isn't handed a Python list to convert
+		# on every one of the thousands of calls the sweeps make
+		self.X1 = np.concatenate([np.full(self.n, P0, dtype = np.float64), np.full(self.n, C0L), np.full(self.n, M0H)])
+		self.X2 = np.concatenate([np.full(self.n, P0, dtype = np.float64), np.full(self.n, C0H), np.full(self.n, M0L)])
+		# the same IC arrays get handed to every run -- freeze them so nothing can
+		# quietly corrupt the starting state between scenarios (odeint copies y0)
+		self.X1.flags.writeable = False
+		self.X2.flags.writeable = False
 		
 
 	# initialize Rassweiler-Briggs model
@@ -87,51 +259,145 @@ class Model:
 
 		frac_dispersed = (1-self.frac_nomove)*(1/(self.n)) # fraction of fish that disperse to other patches symmetrically
 		# transition matrix for dispersal: element [i,j] of kP describes influx of P from j to i
-		kP = np.empty((self.n,self.n))
-		for i in range(self.n):
-			for j in range(self.n):
-				kP[i][j] = frac_dispersed
-				if i == j:
-					kP[i][j] = -frac_dispersed*(self.n - 1)
-		setattr(self,'kP', kP)
+		self.kP = dispersal_matrix(self.n, frac_dispersed) # shared across models, read-only
+		self._alpha = frac_dispersed # see initialize_patch_model
+		self._params = None
 
 		setattr(self, 'P', np.empty(self.n))
 		setattr(self, 'C' , np.empty(self.n))
 		setattr(self,'Mi', np.empty(self.n))
 		setattr(self,'Mv', np.empty(self.n))
-		setattr(self,'dPs', np.empty(self.n))
-		setattr(self,'dCs', np.empty(self.n))
-		setattr(self,'dMis', np.empty(self.n))
-		setattr(self,'dMvs', np.empty(self.n))
-
-		setattr(self, 'X1', [P0]*self.n + [C0L]*self.n + [M0vH]*self.n + [M0iH]*self.n)
-		setattr(self, 'X2', [P0]*self.n + [C0H]*self.n + [M0vL]*self.n + [M0iL]*self.n)
 
-
-	# returns the model run for a certain set of parameters 
-	def run_model(self, IC_set, t):
-		sol = odeint(patch_system, IC_set, t, args = (self, ))
-		return sol 
+		# same treatment as initialize_patch_model: contiguous float64 arrays built
+		# once, frozen so the shared starting state can't be mutated between runs
+		self.X1 = np.concatenate([np.full(self.n, P0, dtype = np.float64), np.full(self.n, C0L), np.full(self.n, M0vH), np.full(self.n, M0iH)])
+		self.X2 = np.concatenate([np.full(self.n, P0, dtype = np.float64), np.full(self.n, C0H), np.full(self.n, M0vL), np.full(self.n, M0iL)])
+		self.X1.flags.writeable = False
+		self.X2.flags.writeable = False
+
+
+	# returns the model run for a certain set of parameters
+	# rtol/atol default to odeint's tight values -- callers that only need a few
+	# significant digits (heatmap bins) can relax them to cut the step count
+	#
+	# note on going further: handing LSODA a C function pointer (numba.cfunc +
+	# numbalsoda, or a Cython extension) would remove the remaining per-step
+	# python dispatch in patch_system. Tried on paper and shelved: it adds a
+	# compiled build/dependency this one-file script otherwise avoids, and the
+	# time-dependent square-wave signal means the RHS needs the full packed
+	# params (incl. kP) marshalled into a C struct per run. Revisit if profiles
+	# ever show dispatch, not the solver, on top.
+	#
+	# single precision was also looked at and dropped: LSODA is double-precision
+	# Fortran, so float32 state would just be upcast on entry; the plotting-side
+	# reductions that tolerate it already use float32 (scenario_plot results,
+	# heatmap cells). Relaxed rtol/atol is the supported way to trade accuracy
+	# for speed here.
+	def run_model(self, IC_set, t, rtol = None, atol = None, mxstep = 0):
+		if self.mgmt_strat == 'MPA' and self.frac_nomove == 1 and self.n > 1:
+			return self.run_mpa_decoupled(IC_set, t, rtol = rtol, atol = atol, mxstep = mxstep)
+		# the vector field jumps every time a closure rotates, so tell LSODA where
+		# the jumps are -- otherwise it steps across them, fails the error test and
+		# backtracks with tiny steps at every single switch
+		tcrit = None
+		cl = getattr(self, 'closure_length', 0)
+		if self.mgmt_strat == 'periodic' and cl > 0 and getattr(self, 'm', 0) > 0:
+			n_switch = int(t[-1] / cl)
+			if 0 < n_switch <= 4*len(t): # skip degenerate closure lengths
+				tcrit = cl*np.arange(1, n_switch + 1)
+		if self._jac is not None:
+			sol = odeint(patch_system, IC_set, t, args = (self, ), Dfun = patch_system_jac, rtol = rtol, atol = atol, mxstep = mxstep, tcrit = tcrit)
+		else:
+			sol = odeint(patch_system, IC_set, t, args = (self, ), rtol = rtol, atol = atol, mxstep = mxstep, tcrit = tcrit)
+		return sol
+
+	# with frac_nomove = 1 the dispersal matrix is zero and the patches fully
+	# decouple; under an MPA each patch is simply "open" or "closed" for the whole
+	# run, so at most two single-patch integrations cover all n patches
+	def run_mpa_decoupled(self, IC_set, t, rtol = None, atol = None, mxstep = 0):
+		IC_set = np.asarray(IC_set, dtype = np.float64)
+		vars_per_patch = len(IC_set) // self.n
+		sol = np.empty((len(t), len(IC_set)))
+		patch_sols = {}
+		for i in range(self.n):
+			# constant in time for an MPA, so it can be folded into f below
+			sig = square_signal(0, self.closure_length, i, self.m, self.n, self.poaching, 'MPA')
+			patch_ICs = tuple(IC_set[i + k*self.n] for k in range(vars_per_patch))
+			key = (sig,) + patch_ICs
+			if key not in patch_sols:
+				# single-patch copy of this model with the signal folded into f
+				z = Model(self.model_type, 1, 1, mgmt_strat = 'MPA')
+				z.__dict__.update({k: v for k, v in self.__dict__.items() if np.isscalar(v)}) # copy the loaded parameters
+				z.n = 1
+				z.frac_nomove = 1
+				z.kP = np.zeros((1, 1))
+				z.set_mgmt_params(self.closure_length, self.f*sig, 0, 0) # m = 0 makes z's own signal 1
+				patch_sols[key] = z.run_model(list(patch_ICs), t, rtol = rtol, atol = atol, mxstep = mxstep)
+			for k in range(vars_per_patch):
+				sol[:, i + k*self.n] = patch_sols[key][:, k]
+		return sol
+
+	# pack everything the compiled RHS needs into a plain tuple of scalars (plus kP),
+	# so the solver never touches self inside its inner loop; the tuple is cached and
+	# only rebuilt after set_mgmt_params / load_parameters / initialize change something
+	def pack_params(self):
+		if self._params is None:
+			self._params = self.build_params()
+		return self._params
+
+	def build_params(self):
+		mgmt_code = MGMT_CODES.get(self.mgmt_strat, 0)
+		sig_table = self.build_signal_table()
+		fl = float
+		# every non-integral slot goes through float(): callers hand us int literals
+		# (load_parameters(1), closure_length = 35, ...) and a stray int64 slot makes
+		# numba compile a fresh signature instead of reusing the one warm_up_jit paid
+		# for at import. n and m stay ints to match the warm-up tuples.
+		if self.model_type == 'RB':
+			return (self.n, self.kP, fl(self._alpha), fl(self.rH), fl(self.K), fl(self.Graze), fl(self.phiC), fl(self.phiM),
+				fl(self.rM), fl(self.gTC), fl(self.gTV), fl(self.gTI), fl(self.gamma), fl(self.omega),
+				fl(self.dC), fl(self.dI), fl(self.dV),
+				fl(self.f), fl(self.closure_length), int(self.m), fl(self.poaching), mgmt_code, sig_table)
+		elif self.model_type in ('vdL', 'vdL_MC', 'vdL_MP', 'vdL_PC'):
+			return (self.n, self.kP, fl(self._alpha), fl(self.s), fl(self.sigma), fl(self.r), fl(self.i_C), fl(self.i_M),
+				fl(self.d), fl(self.gamma), fl(self.g), fl(self.eta), fl(self.alpha),
+				fl(self.f), fl(self.closure_length), int(self.m), fl(self.poaching), mgmt_code, sig_table)
+		else: # BM, and the fallback for bad model types
+			return (self.n, self.kP, fl(self._alpha), fl(self.s), fl(self.beta), fl(self.r), fl(self.d), fl(self.a),
+				fl(self.i_C), fl(self.i_M), fl(self.gamma), fl(self.alpha),
+				fl(self.f), fl(self.closure_length), int(self.m), fl(self.poaching), mgmt_code, sig_table)
+
+	# the signal can only take n distinct per-patch patterns -- one per rotation
+	# state -- so tabulate them once per parameter set; the RHS then turns the
+	# per-patch modular arithmetic into a row lookup via rotation_index
+	def build_signal_table(self):
+		mgmt_code = MGMT_CODES.get(self.mgmt_strat, 0)
+		cl = self.closure_length
+		table = np.empty((self.n, self.n))
+		for start in range(self.n):
+			ts = (start + 0.5)*cl if (mgmt_code == 0 and cl != 0) else 0.0 # mid-interval, safely inside state `start`
+			for i in range(self.n):
+				table[start, i] = square_signal_jit(ts, cl, i, self.m, self.n, self.poaching, mgmt_code)
+		return table
+
+	# the signal only depends on (patch, year) once the management parameters are fixed,
+	# so build the whole (n, T) table once per parameter set instead of re-doing the
+	# modular arithmetic for every (year, patch) pair
+	def get_signal_table(self, T, strat = 'periodic'):
+		key = (T, strat)
+		if key not in self._signal_tables:
+			table = np.empty((self.n, T))
+			for year in range(T):
+				table[:, year] = square_signal_all(year, self.closure_length, self.m, self.n, self.poaching, strat)
+			self._signal_tables[key] = table
+		return self._signal_tables[key]
 
 	def fishing_yield_from_history(self, j, t, P = None, strat = 'periodic'):
 
-		fishing_yield = np.empty(len(t))
-		for year in range(len(t)):
-			if P.all() != None:
-				print("info")
-				print(P[year])
-				print("_")
-				print(self.f)
-				print("_")
-				print(square_signal(year, self.closure_length, j, self.m, self.n, self.poaching, mgmt_strat = 'periodic'))
-				print("end")
-				fishing_yield[year] = P[year]*self.f*square_signal(year, self.closure_length, j, self.m, self.n, self.poaching, mgmt_strat = strat)
-
-			else:
-				fishing_yield[year] = self.P[year]*self.f*square_signal(year, self.closure_length, j, self.m, self.n, self.poaching, mgmt_strat = strat)
-
-
-		return fishing_yield 
+		if P is None: # fall back to the stored parrotfish history
+			P = self.P
+		signal = self.get_signal_table(len(t), strat)
+		return P * self.f * signal[j]
 
 
 	def yield_scenario_plot(self, t, fishing_intensity, IC_set, filename = None, show_legend = False):
@@ -153,30 +419,22 @@ class Model:
 		color_sequence = {periods[0]: '#fa0000', periods[1]: '#fa0092', periods[2]: '#cc00fa' , periods[3]:'#8500fa', periods[4]:'#1400fa'}
 
 
-		print("HERE WE GO")
-		print(self.closure_length)
 		MAX_TIME = len(t)
 
-		# this loops over each closure fraction 
+		# this loops over each closure fraction
 		def yield_loop_over_m_vals(self, t, period, fishing_intensity, IC_set, m):
 
-			# set management parameters for this run 
-			self.set_mgmt_params(period / self.n, fishing_intensity, m, self.poaching)
+			# set management parameters for this run
 			self.set_mgmt_params(period / self.n, fishing_intensity, m, self.poaching)
-			sol = odeint(patch_system, IC_set, t, args = (self, ))
-			avg = 0
+			sol = self.run_model(IC_set, t)
 
+			total = 0.0
 			for j in range(self.n):
-				result_yield = self.fishing_yield_from_history(j, t, sol[:, j])
-				print("yield ")
-				print(result_yield)
-				for year in range(0, len(t)):
-					print("running total")
-					print(total)
-					total += result_yield[year]
+				total += self.fishing_yield_from_history(j, t, sol[:, j]).sum()
 			total = total / self.n
 			total = total / len(t)
-			print("TOTAL ", total)
+			if self.debug:
+				print("TOTAL ", total)
 			if total > 100:
 				total = 0
 			average_result = total - 0.0000001
@@ -189,45 +447,32 @@ class Model:
 			return [m, average_result]
 	   
    
-		print("made it here")
-		final_coral = np.empty(self.n)
-		ms = np.empty(self.n)
-
-		for i, period in enumerate(periods):
-			# final_coral = np.empty(self.n)
-			print("FINAL CORAL AT START: ", final_coral)
-			print("CLOSURE LENGTH IN YEARS: ", float(period) / float(self.n))
-			print("PERIOD IS ", period) 
-			start_year = int(len(t) - float(period) / float(self.n) - len(t)%((float(period)/float(self.n))))
-			print("START YEAR IS ", start_year)
-			end_year = int(len(t) - len(t)%((float(period)/float(self.n))))
-			
-			solutions_pool = mp.Pool(processes = 3) # defaults to num_cpu
-			try:
-			  res = Parallel(n_jobs = 3)(delayed(yield_loop_over_m_vals)(self, t, period, fishing_intensity, IC_set, m) for m in range(self.n))
-			  print(res[0][1])
-			  print("RESULT ABVOE")
-			except ZeroDivisionError:
-			  print("division by zero in yield calculation function")
-			print("RAN RESULTS")
-			for j in range(self.n):
-			  ms[j] = res[j][0]
-			  final_coral[j] = res[j][1]
-			  if final_coral[j] < 0.2:
-			    print("period of ", period)
-			    print("final_coral less than 0.2 when m is: ", ms[j])
-			print(final_coral)
-			print(ms, "is ms")
-    	# plot result for this period
-    	
-			width_sequence = {periods[0]: 1.5, periods[1]: 2, periods[2]: 2.5, periods[3]: 3, periods[4]: 3.5}
+		# one flat dispatch over every (period, m) pair -- a single joblib launch instead
+		# of one per period, and no unused mp.Pool leaking worker processes
+		jobs = [(period, m) for period in periods for m in range(self.n)]
+		try:
+			res = Parallel(n_jobs = 3, backend = 'loky', batch_size = 'auto')(delayed(yield_loop_over_m_vals)(self, t, period, fishing_intensity, IC_set, m) for period, m in jobs)
+		except ZeroDivisionError:
+			print("division by zero in yield calculation function")
+		results = np.asarray(res, dtype = np.float32).reshape(len(periods), self.n, 2)
+		# one (periods, n) matrix per quantity -- each period owns its own row, so
+		# nothing can leak from one period into the next
+		ms_grid = results[:, :, 0]
+		final_coral_grid = results[:, :, 1]
 
+		width_sequence = {periods[0]: 1.5, periods[1]: 2, periods[2]: 2.5, periods[3]: 3, periods[4]: 3.5}
 
+		for i, period in enumerate(periods):
+			ms = ms_grid[i]
+			final_coral = final_coral_grid[i]
+			if self.debug:
+			  print("period ", period, " final yields ", final_coral)
+			# plot result for this period
 			if show_legend:
 			  plt.plot(ms / self.n, final_coral, label = 'period = %s' % str(multipliers[i]), color = color_sequence[period], linewidth=width_sequence[period])
 			else:
 			   plt.plot(ms / self.n, final_coral, label = None, color = color_sequence[period], linewidth=width_sequence[period])# no label
-  
+
     # plt.xlim([0, 1])
 		#plt.ylim([0, 1])
 		plt.xlabel('Fraction closed')
@@ -238,10 +483,9 @@ class Model:
 # plt.show()
 
 
-
 		# make MPA line 
 		z = Model(self.model_type, self.n, self.frac_nomove, mgmt_strat = 'MPA')
-		mpa_corals = np.empty(self.n)
+		mpa_corals = np.empty(self.n, dtype = np.float32)
 		# set initial conditions 
 		z.initialize_patch_model(P0, C0L, C0H, M0L, M0H, M0iL, M0iH)
 		z.load_parameters() # do this inside initializer
@@ -253,19 +497,17 @@ class Model:
 			MPAsol = z.run_model(IC_set, t) 
 			
 			# loop over patches 
-			total = 0 
+			total = 0
 			self.f = fishing_intensity
+			self._params = None # direct assignment bypasses set_mgmt_params
 			for j in range(self.n):
-
-				result_yield = self.fishing_yield_from_history(j, t, MPAsol[:, j], 'MPA')
-				print("RESULT MPA: ", result_yield)
-				for year in range(0, len(t)):
-					total += result_yield[year]
+				total += self.fishing_yield_from_history(j, t, MPAsol[:, j], 'MPA').sum()
 
 			total = total / self.n
 			total = total / len(t)
 			mpa_corals[i] = total
-			print("TOTAL FOR MPA : ", total)
+			if self.debug:
+				print("TOTAL FOR MPA : ", total)
 
 		arr = np.linspace(0, 1, self.n)
 		if show_legend:
@@ -273,7 +515,7 @@ class Model:
 		else:
 		  plt.plot(arr, mpa_corals, label = None, color = 'black')
 		plt.xlim([0, 0.66])
-		if IC_set == self.X1:
+		if np.array_equal(IC_set, self.X1):
 			plt.legend(loc=1)
 		else:
 			plt.legend(loc=3)
@@ -289,18 +531,14 @@ class Model:
 		plt.close()
 
 
-
-
-
 	# make a time series of coral in each patch over time 
 	# to show algae or parrotfish, modify line 110 by adding (algae) or subtracting (parrotfish) 'self.n' to 'self.n + i'
 	def time_series(self, IC_set, t, save, show, show_legend = False):
 
 		fig, ax = plt.subplots()
-		sol = odeint(patch_system, IC_set, t, args = (self, ))
+		sol = self.run_model(IC_set, t)
 		
 		result_yield = self.fishing_yield_from_history(0, t, sol[:, 0])
-		print(result_yield)
 		plt.plot(t, result_yield, label = 'fishing yield', color = 'blue', linewidth = 3)
 		plt.show()
 		
@@ -324,14 +562,15 @@ class Model:
 		  avg = avg / self.n
 		'''
 		
-		scaling_array = np.asarray([1 / recov_time]*len(t))
-
-		time_scaled = np.multiply(scaling_array, t)
-		for i in range(self.n):
+		time_scaled = t * (1.0 / recov_time) # scalar broadcast, no intermediate array
+		# plot every patch with one call -- matplotlib builds the n lines internally
+		# instead of paying per-call setup n times
+		lines = ax.plot(time_scaled, sol[:, self.n:2*self.n])
+		for i, line in enumerate(lines):
 			if show_legend:
-			    ax.plot(time_scaled, sol[:, self.n+i],  label = 'patch % d'% (int(i) + 1))
+			    line.set_label('patch % d'% (int(i) + 1))
 			else:
-			    ax.plot(time_scaled, sol[:, self.n+i],  label = avg)
+			    line.set_label(avg)
 		
 		ax.set_xlabel('Time (scaled to coral recovery time)')
 		
@@ -361,7 +600,7 @@ class Model:
 		# IC_set = self.X2
 		MAX_TIME = len(t) # last year in the model run 
 
-		coral_array =  np.zeros(shape=(int(2/3*self.n), int(2/3*self.n))) # array of long-term coral averages
+		coral_array =  np.zeros(shape=(int(2/3*self.n), int(2/3*self.n)), dtype = np.float32) # array of long-term coral averages
 		# CL_array = np.empty(int(0.75*self.n+1)) # array of closure lenghts 
 		# m_array = np.empty(int(self.n / 2))  # array of number of closures 
 		closure_lengths = np.empty(int(2/3*self.n))
@@ -376,26 +615,18 @@ class Model:
 			# closure_length = int(closure_length / 10) + 1
 			this_closure_length = closure_length *recov_time/self.n
 			period = self.n*this_closure_length
-			# set management parameters for this run 
+			# set management parameters for this run
 			self.set_mgmt_params(this_closure_length, fishing_intensity, m, self.poaching)
-			print("closure length is : ", this_closure_length)
-			# solve ODE system 
-			sol = odeint(patch_system, IC_set, t, args = (self, ))
-			# average over coral cover of last two full rotations for a single patch 
-			avg = 0
-
-			print(len(t))
-			print(int(this_closure_length/recov_time))
-			
-			for year in range(len(t) - int(self.n*this_closure_length) - len(t)%int(self.n*this_closure_length), len(t)):
-			  for j in range(self.n):
-			   avg += sol[year][self.n + j]
-			
-			avg = avg / (int(this_closure_length*self.n) + len(t)%int(self.n*this_closure_length))
-			avg = avg / self.n
-			print("AVERAGE:A ", avg)
-
-			print("made it ")
+			# solve ODE system -- relaxed tolerances, the result just gets bucketed
+			# into a heatmap color anyway
+			sol = self.run_model(IC_set, t, rtol = 1e-5, atol = 1e-7, mxstep = 10000)
+			# average coral cover over the last full rotation (all patches) -- one
+			# slice-mean instead of a T x n Python double loop
+			period_steps = int(self.n*this_closure_length)
+			start = len(t) - period_steps - len(t) % period_steps
+			avg = sol[start:, self.n:2*self.n].mean()
+			if self.debug:
+			  print("closure length ", this_closure_length, " m ", m, " average ", avg)
 			# original heatmap average below
 			# average over time but not patches
 			'''
@@ -408,21 +639,20 @@ class Model:
 		
 			
 			return avg
-	    
 
 
 		recov_time = self.get_coral_recovery_time(t)
-		solutions_pool = mp.Pool(processes = 30) # defaults to num_cpu
 
-		print("justbefore the paralle run executes")
-		final_coral_covers = Parallel(n_jobs = 30)(delayed(fill_heatmap_cell)(self, t, recov_time, fishing_intensity, IC_set, closure_length, m) for m in range(int(self.n*2/3)) for closure_length in range(1, int(2/3*self.n)+1))
-		
-		print(final_coral_covers)
-		print("FINAL CORAL COVERS ABOVE")
-		coral_array = np.transpose((np.asarray(final_coral_covers)).reshape((int(2/3*self.n), int(2/3*self.n))))
-		print(coral_array)
-		print("transposed array above")
-		
+		# every cell is an independent integration of the same system, so saturate the
+		# machine but don't oversubscribe it -- 30 workers on a 4-core laptop just
+		# thrash the scheduler
+		num_cores = min(30, mp.cpu_count())
+		final_coral_covers = Parallel(n_jobs = num_cores, backend = 'loky', batch_size = 'auto')(delayed(fill_heatmap_cell)(self, t, recov_time, fishing_intensity, IC_set, closure_length, m) for m in range(int(self.n*2/3)) for closure_length in range(1, int(2/3*self.n)+1))
+
+		coral_array = np.transpose((np.asarray(final_coral_covers, dtype = np.float32)).reshape((int(2/3*self.n), int(2/3*self.n))))
+		if self.debug:
+			print(coral_array)
+
 		if recov_time < 0:
 			print("oops")
 			print(recov_time)
@@ -499,11 +729,10 @@ class Model:
 		'''
 
 
-
 		mako = ListedColormap(sb.color_palette('viridis').as_hex())
 		
 		# plot closure duration == recovery time line if coral is low 
-		if IC_set == self.X1:
+		if np.array_equal(IC_set, self.X1):
 				print(IC_set)
 				ps = np.linspace(0, self.n, 100)
 				recovery_time_isocline = lambda x: 1*self.n / (x + 0.0000000001)
@@ -516,7 +745,7 @@ class Model:
 		# creating another model object within this one seems unnecessarily funky 
 		
 		z = Model(self.model_type, self.n, 1, mgmt_strat = 'MPA')
-		mpa_corals = np.empty(self.n)
+		mpa_corals = np.empty(self.n, dtype = np.float32)
 		# set initial conditions 
 		z.initialize_patch_model(P0, C0L, C0H, M0L, M0H, M0iL, M0iH)
 		z.load_parameters() # do this inside initializer
@@ -579,7 +808,7 @@ class Model:
 			self.set_mgmt_params(0, f, 0, self.poaching)
 
 			# make high start solution
-			high_sol = odeint(patch_system, self.X2, t, args = (self, ))
+			high_sol = self.run_model(self.X2, t)
 
 			# ------------ yield experiment ------------------ #
 			'''
@@ -593,7 +822,7 @@ class Model:
 
 
 			# make low start solution 
-			low_sol = odeint(patch_system, self.X1, t, args = (self, ))
+			low_sol = self.run_model(self.X1, t)
 
 			# note: this only works without periodic oscillations, which this plot assumes are not present 
 			yrs = len(t)
@@ -626,15 +855,10 @@ class Model:
 
 				self.set_mgmt_params(duration, fishing_intensity, m, self.poaching)
 
-				sol = odeint(patch_system, IC_set, t, args = (self, ))
+				sol = self.run_model(IC_set, t)
 
-				avg = 0
 				# average over last cycle for one patch
-				for year in range(len(t) - duration*self.n, len(t)):
-					avg += sol[year][self.n]
-				avg = avg / (duration*self.n)
-
-				# avg = avg / self.n
+				avg = sol[-duration*self.n:, self.n].mean()
 
 				coral_covers.append(avg)
 
@@ -648,42 +872,47 @@ class Model:
 		plt.show()
 
 
+	def find_unstable_equilibrium(self, t, lowC = 0.1, highC = 0.7, max_depth = 10):
+		""" binary search for unstable equilibrium """
 
-	def find_unstable_equilibrium(self, t, lowC = 0.1, highC = 0.7, recursion_depth = 0):
-		""" binary search for unstable equilibrium """ 
-
+		# only the sign of the drift away from the midpoint matters, so bisect on a
+		# coarse, shortened time grid instead of re-integrating the full horizon at
+		# every level (and iterate -- no need for a stack frame per bisection step)
+		t_short = np.linspace(0, t[-1] / 10, 50)
 
 		midpoint = (lowC + highC) / 2
-		print(midpoint)
+		for depth in range(max_depth):
+			midpoint = (lowC + highC) / 2
+			if self.debug:
+				print(midpoint)
 
+			IC_mid = [0.1]*self.n + [midpoint]*self.n + [0.04]*self.n # verify this
 
-		IC_mid = [0.1]*self.n + [midpoint]*self.n + [0.04]*self.n # verify this 
+			mid_sol = self.run_model(IC_mid, t_short)
+			drift = mid_sol[-1][1] - midpoint
 
-		# run model starting from midpoint -- could reduce runtime by making t smaller 
-		mid_sol = odeint(patch_system, IC_mid, t, args = (self, ))
+			# if coral cover grows from the midpoint, the equilibrium is above it
+			if drift > 0:
+				lowC = midpoint
+			# if coral cover declines from the midpoint, the equilibrium is below it
+			elif drift < 0:
+				highC = midpoint
+			else: # unstable equilibrium found!
+				return midpoint
 
-		if recursion_depth > 10:
-			print("Close enough....")
-			return midpoint
-
-		# if coral cover grows from the midpoint, the equilibrium is above it
-		if mid_sol[len(t) - 1][1] - midpoint > 0:
-			print("going up...")
-			new_recursion_depth = recursion_depth + 1
-			return self.find_unstable_equilibrium(t, lowC = midpoint, recursion_depth = new_recursion_depth)
-		# if coral cover declines from the midpoint, the equilibrium is below it 
-		elif mid_sol[len(t) - 1][1] - midpoint < 0: 
-			print("going down...")
-			new_recursion_depth = recursion_depth + 1
-			return self.find_unstable_equilibrium(t, highC = midpoint, recursion_depth = new_recursion_depth)
-		else: # unstable equilibrium found!
-			return midpoint 
+		return midpoint
 
 
 	# plot coral versus fraction closed for different periods 
-	def scenario_plot(self, t, fishing_intensity, IC_set, filename = None, show_legend = False):
+	def scenario_plot(self, t, fishing_intensity, IC_set, filename = None, show_legend = False, overwrite = False):
 		P0, C0L, C0H, M0L, M0H, M0vH, M0vL, M0iH, M0iL = 0.1, 0.04, 0.4, 0.04, 0.4, 0.04, 0.4, 0.04, 0.4
 
+		# skip the whole run if the plot is already on disk -- re-running main() after a
+		# partial batch only redoes the missing files (pass overwrite = True to force)
+		if filename != None and not overwrite and os.path.isfile(str(filename) + '.jpg'):
+			print("skipping", filename, "-- already exists")
+			return
+
 		crt = self.get_coral_recovery_time(t)
 		if crt == -1:
 			print("coral recovery time too high")
@@ -699,67 +928,54 @@ class Model:
 		# there is a cooler way to do colors than this 
 		# color_sequence = {periods[0]: '#1f77b4', periods[1]: '#aec7e8', periods[2]: '#ff7f0e', periods[3]:'#ffbb78', periods[4]:'#2ca02c'}
 		color_sequence = {periods[0]: '#fa0000', periods[1]: '#fa0092', periods[2]: '#cc00fa' , periods[3]:'#8500fa', periods[4]:'#1400fa'}
-		print("HERE WE GO")
-		print(self.closure_length)
 		MAX_TIME = len(t)
 
-		# this loops over each closure fraction 
+		# this loops over each closure fraction
 		def loop_over_m_vals(self, t, period, fishing_intensity, IC_set, m):
 
 			# set management parameters for this run  -- Divided by n in original??
 			self.set_mgmt_params(period / self.n, fishing_intensity, m, self.poaching)
-			self.set_mgmt_params(period / self.n, fishing_intensity, m, self.poaching)
-			sol = odeint(patch_system, IC_set, t, args = (self, ))
+			sol = self.run_model(IC_set, t)
 			avg = 0
-			# print(sol[MAX_TIME - 1])
 
 			for year in range(MAX_TIME - 2*int(period)  - MAX_TIME % int(period), MAX_TIME - MAX_TIME % int(period)):
 			  for j in range(self.n):
 			   avg += sol[year][self.n + j]
 			avg = avg / (2*period)
 			avg = avg / self.n
-      
-			
-			print("Average ",  m, "is ", avg, "when period is", period)
-			final_coral[m] = avg
-			ms[m] = m
+
+			if self.debug:
+			  print("Average ",  m, "is ", avg, "when period is", period)
 
 			return [m, avg]
-	   
-   
-		print("made it here")
-		for i, period in enumerate(periods):
-			final_coral = np.empty(self.n)
-			print("CLOSURE LENGTH IN YEARS: ", float(period) / float(self.n))
-			print("PERIOD IS ", period) 
-			start_year = int(len(t) - float(period) / float(self.n) - len(t)%((float(period)/float(self.n))))
-			print("START YEAR IS ", start_year)
-			end_year = int(len(t) - len(t)%((float(period)/float(self.n))))
-			print("END YEAR IS ", end_year)
-			ms = np.empty(self.n)
-			solutions_pool = mp.Pool(processes = 3) # defaults to num_cpu
-			try:
-			  res = Parallel(n_jobs = 3)(delayed(loop_over_m_vals)(self, t, period, fishing_intensity, IC_set, m) for m in range(self.n))
-			except ZeroDivisionError:
-			  print("divide by  zero ")
-			for j in range(self.n):
-			  ms[j] = res[j][0]
-			  final_coral[j] = res[j][1]
-			  if final_coral[j] < 0.2:
-			    print("period of ", period)
-			    print("final_coral less than 0.2 when m is: ", ms[j])
-			print(final_coral)
-			print(ms, "is ms")
-    	# plot result for this period
-    	
-			width_sequence = {periods[0]: 1.5, periods[1]: 2, periods[2]: 2.5, periods[3]: 3, periods[4]: 3.5}
 
 
+		# one flat dispatch over every (period, m) pair -- a single joblib launch instead
+		# of one per period, and no unused mp.Pool leaking worker processes
+		jobs = [(period, m) for period in periods for m in range(self.n)]
+		try:
+			res = Parallel(n_jobs = 3, backend = 'loky', batch_size = 'auto')(delayed(loop_over_m_vals)(self, t, period, fishing_intensity, IC_set, m) for period, m in jobs)
+		except ZeroDivisionError:
+			print("divide by  zero ")
+		results = np.asarray(res, dtype = np.float32).reshape(len(periods), self.n, 2)
+		# one (periods, n) matrix per quantity -- each period owns its own row, so
+		# nothing can leak from one period into the next
+		ms_grid = results[:, :, 0]
+		final_coral_grid = results[:, :, 1]
+
+		width_sequence = {periods[0]: 1.5, periods[1]: 2, periods[2]: 2.5, periods[3]: 3, periods[4]: 3.5}
+
+		for i, period in enumerate(periods):
+			ms = ms_grid[i]
+			final_coral = final_coral_grid[i]
+			if self.debug:
+			  print("period ", period, " final coral ", final_coral)
+			# plot result for this period
 			if show_legend:
-			  plt.plot(ms / self.n, final_coral, label = 'period = %s' % str(multipliers[i]), color = color_sequence[period], linewidth=width_sequence[period])
+			  plt.plot(ms / self.n, final_coral, label = 'period = %s' % str(multipliers[i]), color = color_sequence[period], linewidth=width_sequence[period], rasterized = True)
 			else:
-			   plt.plot(ms / self.n, final_coral, label = None, color = color_sequence[period], linewidth=width_sequence[period])# no label
-  
+			   plt.plot(ms / self.n, final_coral, label = None, color = color_sequence[period], linewidth=width_sequence[period], rasterized = True)# no label
+
     # plt.xlim([0, 1])
 		plt.ylim([0, 1])
 		plt.xlabel('Fraction closed')
@@ -770,10 +986,9 @@ class Model:
 # plt.show()
 
 
-
 		# make MPA line 
 		z = Model(self.model_type, self.n, self.frac_nomove, mgmt_strat = 'MPA')
-		mpa_corals = np.empty(self.n)
+		mpa_corals = np.empty(self.n, dtype = np.float32)
 		# set initial conditions 
 		z.initialize_patch_model(P0, C0L, C0H, M0L, M0H, M0iL, M0iH)
 		z.load_parameters() # do this inside initializer
@@ -795,38 +1010,145 @@ class Model:
 
 		arr = np.linspace(0, 1, self.n)
 		if show_legend:
-		  plt.plot(arr, mpa_corals, label = 'MPA', color = 'black')
+		  plt.plot(arr, mpa_corals, label = 'MPA', color = 'black', rasterized = True)
 		else:
-		  plt.plot(arr, mpa_corals, label = None, color = 'black')
+		  plt.plot(arr, mpa_corals, label = None, color = 'black', rasterized = True)
 		plt.xlim([0, 0.66])
-		if IC_set == self.X1:
-			plt.legend(loc=1)
-		else:
-			plt.legend(loc=3)
+		# without labels the legend would be an empty box, so don't build one at all
+		if show_legend:
+			if np.array_equal(IC_set, self.X1):
+				plt.legend(loc=1)
+			else:
+				plt.legend(loc=3)
 	
 		# plt.show()
 		
 		if filename == None:
-			plt.savefig('newest_scenario_plot' + str(self.model_type) + '_' + str(fishing_intensity) + '_' + str(IC_set[self.n]) + '_' + str(self.poaching) + '_' + str(self.frac_nomove)+'.jpg')
+			plt.savefig('newest_scenario_plot' + str(self.model_type) + '_' + str(fishing_intensity) + '_' + str(IC_set[self.n]) + '_' + str(self.poaching) + '_' + str(self.frac_nomove)+'.jpg', dpi = 100)
 		else:
-			plt.savefig(str(filename) + '.jpg')
+			plt.savefig(str(filename) + '.jpg', dpi = 100)
 
 		plt.close()
 
 
+	# scenario plots for both starting conditions of the same model in one call --
+	# the recovery time, the worker pool launch and the MPA comparison model get
+	# shared across the two figures instead of being redone per starting condition.
+	# Saves to filenames[0]/filenames[1], so the files match two scenario_plot calls
+	def scenario_plot_pair(self, t, fishing_intensity, IC_sets = None, filenames = (None, None), show_legends = (False, True), overwrite = False):
+		P0, C0L, C0H, M0L, M0H, M0vH, M0vL, M0iH, M0iL = 0.1, 0.04, 0.4, 0.04, 0.4, 0.04, 0.4, 0.04, 0.4
+
+		if IC_sets is None:
+			IC_sets = (self.X1, self.X2)
+		todo = []
+		for k in range(2):
+			if filenames[k] != None and not overwrite and os.path.isfile(str(filenames[k]) + '.jpg'):
+				print("skipping", filenames[k], "-- already exists")
+			else:
+				todo.append(k)
+		if not todo:
+			return
 
+		crt = self.get_coral_recovery_time(t)
+		if crt == -1:
+			print("coral recovery time too high")
+			quit()
+		print("crt: ", crt)
 
+		multipliers = np.asarray([0.25, 0.5, 1, 2, 4])
+		periods = crt*multipliers
+		color_sequence = {periods[0]: '#fa0000', periods[1]: '#fa0092', periods[2]: '#cc00fa' , periods[3]:'#8500fa', periods[4]:'#1400fa'}
+		width_sequence = {periods[0]: 1.5, periods[1]: 2, periods[2]: 2.5, periods[3]: 3, periods[4]: 3.5}
+		MAX_TIME = len(t)
 
-	# calculate coral recovery time based on model type 
+		# same per-cell worker as scenario_plot
+		def loop_over_m_vals(self, t, period, fishing_intensity, IC_set, m):
+			self.set_mgmt_params(period / self.n, fishing_intensity, m, self.poaching)
+			sol = self.run_model(IC_set, t)
+			avg = 0
+			for year in range(MAX_TIME - 2*int(period)  - MAX_TIME % int(period), MAX_TIME - MAX_TIME % int(period)):
+			  for j in range(self.n):
+			   avg += sol[year][self.n + j]
+			avg = avg / (2*period)
+			avg = avg / self.n
+			return [m, avg]
+
+		# every (IC, period, m) integration in one pool launch
+		jobs = [(k, period, m) for k in todo for period in periods for m in range(self.n)]
+		try:
+			res = Parallel(n_jobs = 3, backend = 'loky', batch_size = 'auto')(delayed(loop_over_m_vals)(self, t, period, fishing_intensity, IC_sets[k], m) for k, period, m in jobs)
+		except ZeroDivisionError:
+			print("divide by  zero ")
+		results = np.asarray(res, dtype = np.float32).reshape(len(todo), len(periods), self.n, 2)
+
+		# one MPA comparison model for both figures
+		z = Model(self.model_type, self.n, self.frac_nomove, mgmt_strat = 'MPA')
+		z.initialize_patch_model(P0, C0L, C0H, M0L, M0H, M0iL, M0iH)
+		z.load_parameters()
+		arr = np.linspace(0, 1, self.n)
+
+		for slot, k in enumerate(todo):
+			IC_set = IC_sets[k]
+			show_legend = show_legends[k]
+			for i, period in enumerate(periods):
+				ms = results[slot, i, :, 0]
+				final_coral = results[slot, i, :, 1]
+				if show_legend:
+				  plt.plot(ms / self.n, final_coral, label = 'period = %s' % str(multipliers[i]), color = color_sequence[period], linewidth=width_sequence[period], rasterized = True)
+				else:
+				   plt.plot(ms / self.n, final_coral, label = None, color = color_sequence[period], linewidth=width_sequence[period], rasterized = True)
+			plt.ylim([0, 1])
+			plt.xlabel('Fraction closed')
+			plt.ylabel('Average final coral cover')
+			plt.rc('axes', labelsize = 12)
+			plt.rc('axes', titlesize = 12)
+
+			mpa_corals = np.empty(self.n, dtype = np.float32)
+			for i in range(self.n):
+				z.set_mgmt_params(500, fishing_intensity, i, self.poaching)
+				MPAsol = z.run_model(IC_set, t)
+				total = 0
+				for j in range(self.n):
+					total += MPAsol[len(t) - 1][j+self.n]
+				mpa_corals[i] = total / self.n
+
+			if show_legend:
+			  plt.plot(arr, mpa_corals, label = 'MPA', color = 'black', rasterized = True)
+			else:
+			  plt.plot(arr, mpa_corals, label = None, color = 'black', rasterized = True)
+			plt.xlim([0, 0.66])
+			if show_legend:
+				if np.array_equal(IC_set, self.X1):
+					plt.legend(loc=1)
+				else:
+					plt.legend(loc=3)
+
+			if filenames[k] == None:
+				plt.savefig('newest_scenario_plot' + str(self.model_type) + '_' + str(fishing_intensity) + '_' + str(IC_set[self.n]) + '_' + str(self.poaching) + '_' + str(self.frac_nomove)+'.jpg', dpi = 100)
+			else:
+				plt.savefig(str(filenames[k]) + '.jpg', dpi = 100)
+			plt.close()
+
+
+	# calculate coral recovery time based on model type
 	def get_coral_recovery_time(self, t):
 
+		# the answer only depends on (model_type, n), the loaded fish growth rate, and
+		# the time grid, so don't redo the MPA solve when scenario plots / heatmaps
+		# ask for it repeatedly -- repeated load_parameters calls with the same rate
+		# come back from the cache for free
+		fgr = getattr(self, 'rH' if self.model_type == 'RB' else 's', 1)
+		key = (self.model_type, self.n, fgr, len(t), t[-1])
+		if key in self._crt_cache:
+			return self._crt_cache[key]
+
 		P0, C0L, C0H, M0L, M0H, M0vH, M0vL, M0iH, M0iL = 0.1, 0.04, 0.4, 0.04, 0.4, 0.04, 0.4, 0.04, 0.4
 
 
 		z = Model(self.model_type, self.n, 1, mgmt_strat = 'MPA')
 		# set initial conditions 
 		z.initialize_patch_model(P0, C0L, C0H, M0L, M0H, M0iL, M0iH)
-		z.load_parameters() # do this inside initializer
+		z.load_parameters(fgr) # recover with the same growth rate we're currently using
 
 		z.set_mgmt_params(500, 0, 0, 0)
 
@@ -847,283 +1169,312 @@ class Model:
 		else: 
 			high_coral_eq = 0.7
 
-		coral_recovery_time = -1
-		for i, state in enumerate(coralsol):
-			if state > high_coral_eq:
-				coral_recovery_time = i
-				break
-
-		return coral_recovery_time + 10
+		exceeded = coralsol > high_coral_eq
+		if exceeded.any():
+			coral_recovery_time = int(np.argmax(exceeded))
+		else:
+			coral_recovery_time = -1
 
+		self._crt_cache[key] = coral_recovery_time + 10
+		return self._crt_cache[key]
 
 
 	def load_parameters(self, fish_growth_rate = 1):
-		if self.model_type == 'vdL':
-			params = {
-			"r": 0.3,
-			"i_C" : 0.05,
-			"i_M" : 0.05,
-			"ext_C" : 0.0001,
-			"ext_P" : 0.0001,
-			"gamma" : 0.8,
-			"d" : 0.1,
-			"g" : 1,
-			"s" : fish_growth_rate,
-			"sigma" : .5, #strength of coral-herbivore feedback
-			"eta" : 2, #strength of algae-herbivore feedback
-			"alpha" : 0.5, #strength of algae-coral feedback 
-			"P0" : 0.1, # why are these here? try commenting out to see if breaks anything - dec 5 
-			"C_HI" : .4,
-			"M_LO" : .04,
-			"C_LO" : .04,
-			"M_HI" : .4
-			}
-
-		elif self.model_type == 'vdL_MC':
-			params = {
-			"r": 0.3,
-			"i_C" : 0.05,
-			"i_M" : 0.05,
-			"ext_C" : 0.0001,
-			"ext_P" : 0.0001,
-			"gamma" : 0.8,
-			"d" : 0.1,
-			"g" : 1,
-			"s" : fish_growth_rate,
-			"sigma" : 0, #strength of coral-herbivore feedback
-			"eta" : 0, #strength of algae-herbivore feedback
-			"alpha" : 2 #strength of algae-coral feedback 
-			}
-
-		elif self.model_type == 'vdL_MP':
-			params = {
-			"r": 0.3,
-			"i_C" : 0.05,
-			"i_M" : 0.05,
-			"ext_C" : 0.0001,
-			"ext_P" : 0.0001,
-			"gamma" : 0.8,
-			"d" : 0.1,
-			"g" : 1,
-			"s" : fish_growth_rate,
-			"sigma" : 0, #strength of coral-herbivore feedback
-			"eta" : 4, #strength of algae-herbivore feedback
-			"alpha" : 0 #strength of algae-coral feedback 
-			}
-
-		elif self.model_type == 'vdL_PC':
-			params = {
-			"r": 0.3,
-			"i_C" : 0.05,
-			"i_M" : 0.05,
-			"ext_C" : 0.0001,
-			"ext_P" : 0.0001,
-			"gamma" : 0.8,
-			"d" : 0.1,
-			"g" : 1,
-			"s" : fish_growth_rate,
-			"sigma" : .9, #strength of coral-herbivore feedback
-			"eta" : 0, #strength of algae-herbivore feedback
-			"alpha" : 0, #strength of algae-coral feedback 
-			}
+		self.__dict__.update(load_params_cached(self.model_type, fish_growth_rate))
 
-		elif self.model_type == 'BM':
-			params = {
-			"gamma" : 0.8,
-			"beta" : 1,
-			"alpha" : 1,
-			"s" : fish_growth_rate, # 0.49,
-			"r" : 1,
-			"d" : 0.44,
-			"a" : 0.1,
-			"i_C" : 0.05,
-			"i_M" : 0.05
-			}
-
-		elif self.model_type == 'RB':
-			params = {
-			"phiC" : 0.001, #open recruitment of coral
-			"phiM" : 0.0001, #open recruitment of macroalgae
-
-			"rM" : 0.5, #production of vulnerable macroalgae from invulnerable stage"
-
-			#growth rates
-			"gTC" : 0.1, #combined rate of growth and local recruitment of corals over free space 
-			"gTV" : 0.2, #growth rate of vulnerable macroalgae over free space 
-			"gTI" : 0.4, #growth rate of invulnerable macroalgae over free space 
-			"rH" : fish_growth_rate, #0.49,
-
-			"gamma" : 0.4, #growth of macroalgae over coral vs free space
-			"omega" : 2, #maturation rate of macroalgae from vulnerable to invulnerable class "
-
-			#death rates
-			"dC" : 0.05, #death rate of coral 
-			"dI" : 0.4, #death rate of invulnerable macroalgae
-			"dV" : 0.4, #death rate of vulnerable macroalgae per unit biomass of herbivores "
-
-			"K" : 20, 
-			"Graze" : 0.58
-			}
-
-		for name, val in params.items():
-		
-			setattr(self, name, val)
+		self._params = None # packed tuple must be rebuilt with the new values
 
-	# management parameter setter 
+	# management parameter setter
 	def set_mgmt_params(self, closure_length, f, m, poaching):
+		if (closure_length, f, m, poaching) == (self.closure_length, self.f, self.m, self.poaching):
+			return # nothing changed -- keep the cached signal tables
 		self.closure_length = closure_length
 		self.f = f
 		self.m = m
-		self.poaching = poaching 
-
-
+		self.poaching = poaching
+		self._signal_tables = {} # cached tables are stale once the parameters change
+		self._params = None
 
 
 def patch_system(X, t, system_model):
-	P_influx = [0]*system_model.n
-
-	for i in range(system_model.n):
-
-		# add influx at end AFTER the parrotfish have been initialized so it isn't populated with random values
-		for j in range(system_model.n):
-			P_influx[i] += (system_model.kP[i][j]) * X[j]  # X[j] first n entries are the parrotfish pops
-
-		# this could be structured more nicely
-		if system_model.model_type == 'RB':
-			
-			results = rass_briggs(X, t, i, system_model, P_influx)
-			system_model.dPs[i] = results[0]
-			system_model.dCs[i] = results[1]
-			system_model.dMvs[i] = results[2]
-			system_model.dMis[i] = results[3]
-
-		elif system_model.model_type == 'BM':
-			
-			results = blackwood(X, t, i, system_model, P_influx)
-			system_model.dPs[i] = results[0]
-			system_model.dCs[i] = results[1]
-			system_model.dMs[i] = results[2]
-
-		elif system_model.model_type == 'vdL_PC':
-			
-			results = leemput(X, t, i, system_model, P_influx)
-			system_model.dPs[i] = results[0]
-			system_model.dCs[i] = results[1]
-			system_model.dMs[i] = results[2]
-
-		elif system_model.model_type == 'vdL_MP':
-			results = leemput(X, t, i, system_model, P_influx)
-			system_model.dPs[i] = results[0]
-			system_model.dCs[i] = results[1]
-			system_model.dMs[i] = results[2]
-
-		elif system_model.model_type == 'vdL_MC':
-			
-			results = leemput(X, t, i, system_model, P_influx)
-			system_model.dPs[i] = results[0]
-			system_model.dCs[i] = results[1]
-			system_model.dMs[i] = results[2]
-
-		elif system_model.model_type == 'vdL': # all feedbacks active 
-
-			results = leemput(X, t, i, system_model, P_influx)
-			# print(leemput(X, t, i, system_model, P_influx))
-			system_model.dPs[i] = results[0]
-			system_model.dCs[i] = results[1]
-			system_model.dMs[i] = results[2]
-			
-		else:
-			print("Bad input, defaulting to Blackwood-Mumby!")
-			results = blackwood(X, t, i, system_model, P_influx)
-			system_model.dPs[i] = results[0]
-			system_model.dCs[i] = results[1]
-			system_model.dMs[i] = results[2]
-
-		
-	if system_model.model_type == 'RB':
-		return np.concatenate((system_model.dPs, system_model.dCs, system_model.dMvs, system_model.dMis), axis = 0)
-	else:
-		return np.concatenate((system_model.dPs, system_model.dCs, system_model.dMs), axis = 0)
-
-def rass_briggs(X, t, i, system_model, P_influx):
-
-
-	P, C, Mv, Mi = X.reshape(4, system_model.n)
-	T = 1 - C[i] - Mv[i] - Mi[i]
-	
-	
-	dP = P_influx[i]+system_model.rH*P[i]*(1-P[i]/system_model.K) - system_model.f*P[i] *(square_signal(t, system_model.closure_length, i, system_model.m, system_model.n, system_model.poaching, system_model.mgmt_strat))
-	
-
-	dC = (system_model.phiC*T) + system_model.gTC*T*C[i] - system_model.gamma*system_model.gTI*Mi[i]*C[i] - system_model.dC*C[i]
-
-	dMv = system_model.phiM*T + system_model.rM*T*Mi[i] + system_model.gTV*T*Mv[i] - system_model.dV*Mv[i] - P[i]*Mv[i]*system_model.Graze - system_model.omega * Mv[i]
-	dMi = system_model.omega*Mv[i] + system_model.gTI*T*Mi[i] + system_model.gamma*system_model.gTI*Mi[i]*C[i] - system_model.dI*Mi[i]
-	# print(P, C, Mv, Mi)
-	# print(system_model.f)#/(1-system_model.m/system_model.n))# *P[i] *(square_signal(t, system_model.closure_length, i, system_model.m, system_model.n, system_model.poaching)))
-	return [dP, dC, dMv, dMi]
-
-	
-	# dP = P_influx[i] + system_model.rH*P[i]*(1-P[i]/system_model.K) - system_model.f/(1-system_model.m/system_model.n)*P[i] *(square_signal(t, system_model.closure_length, i, sysem_model.m, system_model.n, system_model.poaching))
-# 	dC = (system_model.phiC*T) + gTC*T*C - gamma*gTI*Mi*C - dC*C
-# 	dMv = phiM*T + rM*T*Mi + gTV*T*Mv - dV*Mv - P*Mv*Graze - omega * Mv
-
-# 	dMi = omega*Mv + gTI*T*Mi + gamma*gTI*Mi*C - dI*Mi
-	# return [dP, dC, dMv, dMi]
-
+	# thin dispatcher -- the real work happens in the module-level (optionally jitted)
+	# RHS functions below, which only see plain arrays and a packed parameter tuple
+	# odeint always hands us a contiguous float64 ndarray, so no asarray/reshape is
+	# needed -- the RHS takes plain slice views of X. _dY is the preallocated scratch
+	# buffer from __init__; the solver copies the return value before the next call,
+	# so reusing it every step is safe
+	return system_model._rhs(X, t, system_model.pack_params(), system_model._dY)
+
+
+# van de Leemput RHS over all patches (covers vdL and the single-feedback variants)
+@njit(cache = True, fastmath = True)
+def leemput_rhs(X, t, params, dX):
+	n, kP, aD, s, sigma, r, i_C, i_M, d, gamma, g, eta, alpha, f, closure_length, m, poaching, mgmt_code, sig_table = params
+	P = X[0:n]
+	C = X[n:2*n]
+	M = X[2*n:3*n]
+	# hoist the loop-invariant pieces; inside the loop every subexpression is used
+	# at most once so the whole patch update is a single pass over P, C, M
+	aDsum = aD * P.sum()
+	aDn = aD * n
+	sig_row = sig_table[rotation_index(t, closure_length, n)]
+	for i in range(n):
+		sig = sig_row[i]
+		free = 1 - M[i] - C[i]
+		dX[i] = aDsum - aDn*P[i] + s*P[i]*(1 - P[i]/((1-sigma)+sigma*C[i])) - f*P[i]*sig
+		dX[n+i] = (i_C + r*C[i])*free*(1-alpha*M[i]) - d*C[i]
+		dX[2*n+i] = (i_M + gamma*M[i])*free - g*M[i]*P[i]/(g*eta*M[i]+1)
+	return dX
+
+
+# Blackwood-Mumby RHS over all patches
+@njit(cache = True, fastmath = True)
+def blackwood_rhs(X, t, params, dX):
+	n, kP, aD, s, beta, r, d, a, i_C, i_M, gamma, alpha, f, closure_length, m, poaching, mgmt_code, sig_table = params
+	P = X[0:n]
+	C = X[n:2*n]
+	M = X[2*n:3*n]
+	aDsum = aD * P.sum()
+	aDn = aD * n
+	alpha_beta = alpha / beta
+	imm_C = 0.0005 * i_C
+	imm_M = 0.0075 * i_M
+	sig_row = sig_table[rotation_index(t, closure_length, n)]
+	for i in range(n):
+		sig = sig_row[i]
+		free = 1 - M[i] - C[i]
+		MC = a*M[i]*C[i]
+		dX[i] = aDsum - aDn*P[i] + s*P[i]*(1 - (P[i] / (beta*(1 - 0.5*C[i])))) - f*P[i]*sig
+		dX[n+i] = r*free*C[i] - d*C[i] - MC + imm_C*free
+		dX[2*n+i] = MC - alpha_beta*P[i]*M[i]/(1-C[i]) + gamma*M[i]*free + imm_M*free
+	return dX
+
+
+# Rassweiler-Briggs RHS over all patches (4 state variables per patch)
+@njit(cache = True, fastmath = True)
+def rass_briggs_rhs(X, t, params, dX):
+	n, kP, aD, rH, K, Graze, phiC, phiM, rM, gTC, gTV, gTI, gamma, omega, d_C, d_I, d_V, f, closure_length, m, poaching, mgmt_code, sig_table = params
+	P = X[0:n]
+	C = X[n:2*n]
+	Mv = X[2*n:3*n]
+	Mi = X[3*n:4*n]
+	aDsum = aD * P.sum()
+	aDn = aD * n
+	ggTI = gamma * gTI
+	sig_row = sig_table[rotation_index(t, closure_length, n)]
+	for i in range(n):
+		sig = sig_row[i]
+		T = 1 - C[i] - Mv[i] - Mi[i]
+		overgrowth = ggTI*Mi[i]*C[i]
+		dX[i] = aDsum - aDn*P[i] + rH*P[i]*(1-P[i]/K) - f*P[i]*sig
+		dX[n+i] = phiC*T + gTC*T*C[i] - overgrowth - d_C*C[i]
+		dX[2*n+i] = phiM*T + rM*T*Mi[i] + gTV*T*Mv[i] - d_V*Mv[i] - P[i]*Mv[i]*Graze - omega*Mv[i]
+		dX[3*n+i] = omega*Mv[i] + gTI*T*Mi[i] + overgrowth - d_I*Mi[i]
+	return dX
+
+
+RHS_FUNCS = {
+	'vdL': leemput_rhs,
+	'vdL_MC': leemput_rhs,
+	'vdL_MP': leemput_rhs,
+	'vdL_PC': leemput_rhs,
+	'BM': blackwood_rhs,
+	'RB': rass_briggs_rhs,
+}
+
+
+# analytic Jacobians -- the dispersal block is just kP, the reaction blocks are
+# diagonal (patches only couple through parrotfish dispersal), so LSODA gets the
+# exact matrix instead of estimating it with 3n extra RHS calls per Newton step
+@njit(cache = True, fastmath = True)
+def leemput_jac(X, t, params):
+	n, kP, aD, s, sigma, r, i_C, i_M, d, gamma, g, eta, alpha, f, closure_length, m, poaching, mgmt_code, sig_table = params
+	P = X[0:n]
+	C = X[n:2*n]
+	M = X[2*n:3*n]
+	J = np.zeros((3*n, 3*n))
+	sig_row = sig_table[rotation_index(t, closure_length, n)]
+	# the dispersal block has just two distinct values (see initialize_patch_model),
+	# so write them directly instead of copying kP element by element
+	for i in range(n):
+		for j in range(n):
+			J[i, j] = aD
+		J[i, i] = -aD*(n - 1)
+		sig = sig_row[i]
+		K = (1-sigma)+sigma*C[i]
+		J[i, i] += s*(1 - 2*P[i]/K) - f*sig
+		J[i, n+i] = s*sigma*P[i]*P[i]/(K*K)
+		J[n+i, n+i] = r*(1-M[i]-C[i])*(1-alpha*M[i]) - (i_C+r*C[i])*(1-alpha*M[i]) - d
+		J[n+i, 2*n+i] = -(i_C+r*C[i])*((1-alpha*M[i]) + alpha*(1-M[i]-C[i]))
+		denom = g*eta*M[i]+1
+		J[2*n+i, i] = -g*M[i]/denom
+		J[2*n+i, n+i] = -(i_M+gamma*M[i])
+		J[2*n+i, 2*n+i] = gamma*(1-M[i]-C[i]) - (i_M+gamma*M[i]) - g*P[i]/(denom*denom)
+	return J
+
+
+@njit(cache = True, fastmath = True)
+def blackwood_jac(X, t, params):
+	n, kP, aD, s, beta, r, d, a, i_C, i_M, gamma, alpha, f, closure_length, m, poaching, mgmt_code, sig_table = params
+	P = X[0:n]
+	C = X[n:2*n]
+	M = X[2*n:3*n]
+	J = np.zeros((3*n, 3*n))
+	sig_row = sig_table[rotation_index(t, closure_length, n)]
+	# the dispersal block has just two distinct values (see initialize_patch_model),
+	# so write them directly instead of copying kP element by element
+	for i in range(n):
+		for j in range(n):
+			J[i, j] = aD
+		J[i, i] = -aD*(n - 1)
+		sig = sig_row[i]
+		K = beta*(1 - 0.5*C[i])
+		J[i, i] += s*(1 - 2*P[i]/K) - f*sig
+		J[i, n+i] = -0.5*beta*s*P[i]*P[i]/(K*K)
+		J[n+i, n+i] = r*(1-M[i]-C[i]) - r*C[i] - d - a*M[i] - 0.0005*i_C
+		J[n+i, 2*n+i] = -r*C[i] - a*C[i] - 0.0005*i_C
+		J[2*n+i, i] = -alpha/beta*M[i]/(1-C[i])
+		J[2*n+i, n+i] = a*M[i] - alpha/beta*P[i]*M[i]/((1-C[i])*(1-C[i])) - gamma*M[i] - 0.0075*i_M
+		J[2*n+i, 2*n+i] = a*C[i] - alpha/beta*P[i]/(1-C[i]) + gamma*(1-2*M[i]-C[i]) - 0.0075*i_M
+	return J
+
+
+@njit(cache = True, fastmath = True)
+def rass_briggs_jac(X, t, params):
+	n, kP, aD, rH, K, Graze, phiC, phiM, rM, gTC, gTV, gTI, gamma, omega, d_C, d_I, d_V, f, closure_length, m, poaching, mgmt_code, sig_table = params
+	P = X[0:n]
+	C = X[n:2*n]
+	Mv = X[2*n:3*n]
+	Mi = X[3*n:4*n]
+	J = np.zeros((4*n, 4*n))
+	sig_row = sig_table[rotation_index(t, closure_length, n)]
+	# the dispersal block has just two distinct values (see initialize_patch_model),
+	# so write them directly instead of copying kP element by element
+	for i in range(n):
+		for j in range(n):
+			J[i, j] = aD
+		J[i, i] = -aD*(n - 1)
+		sig = sig_row[i]
+		T = 1 - C[i] - Mv[i] - Mi[i]
+		J[i, i] += rH*(1 - 2*P[i]/K) - f*sig
+		J[n+i, n+i] = -phiC + gTC*(T - C[i]) - gamma*gTI*Mi[i] - d_C
+		J[n+i, 2*n+i] = -phiC - gTC*C[i]
+		J[n+i, 3*n+i] = -phiC - gTC*C[i] - gamma*gTI*C[i]
+		J[2*n+i, i] = -Mv[i]*Graze
+		J[2*n+i, n+i] = -phiM - rM*Mi[i] - gTV*Mv[i]
+		J[2*n+i, 2*n+i] = -phiM - rM*Mi[i] + gTV*(T - Mv[i]) - d_V - P[i]*Graze - omega
+		J[2*n+i, 3*n+i] = -phiM + rM*(T - Mi[i]) - gTV*Mv[i]
+		J[3*n+i, n+i] = -gTI*Mi[i] + gamma*gTI*Mi[i]
+		J[3*n+i, 2*n+i] = omega - gTI*Mi[i]
+		J[3*n+i, 3*n+i] = gTI*(T - Mi[i]) + gamma*gTI*C[i] - d_I
+	return J
+
+
+JAC_FUNCS = {
+	'vdL': leemput_jac,
+	'vdL_MC': leemput_jac,
+	'vdL_MP': leemput_jac,
+	'vdL_PC': leemput_jac,
+	'BM': blackwood_jac,
+	'RB': rass_briggs_jac,
+}
+
+
+def patch_system_jac(X, t, system_model):
+	return system_model._jac(X, t, system_model.pack_params())
+
+# parrotfish carrying capacities as a function of coral cover
+@njit(cache = True, fastmath = True)
+def K(sigma, C):
+	return (1-sigma)+sigma*C
 
-	# check input
-	# return None 
 
-def K(sigma, C):
-		return (1-sigma)+sigma*C
+@njit(cache = True, fastmath = True)
 def BMK(C):
 	return 1 - 0.5*C
 
 
-# turns fishing on and off 
-def square_signal(t, closure_length, region, m, n, poaching, mgmt_strat = 'periodic'):
-
-	if mgmt_strat == 'periodic':
+# fishing intensity on an open patch, scaled up so total effort is conserved when
+# m of n patches are closed (poached effort stays inside the closures)
+@njit(cache = True, fastmath = True)
+def open_fishing_value(m, n, poaching):
+	return (1 - (m/n)*poaching)/(1 - (m/n))
 
-		if closure_length != 0: 
 
+# turns fishing on and off
+def square_signal(t, closure_length, region, m, n, poaching, mgmt_strat = 'periodic'):
+	return square_signal_jit(t, closure_length, region, m, n, poaching, MGMT_CODES.get(mgmt_strat, 0))
+
+
+# which rotation state the schedule is in at time t -- row index into the
+# precomputed signal table the RHS/Jacobian functions carry in their params
+@njit(cache = True, fastmath = True)
+def rotation_index(t, closure_length, n):
+	if closure_length != 0:
+		# t % (n*cl) is < n*cl mathematically, but a few ULPs under a full-cycle
+		# boundary the division can still round up to n -- and tcrit parks the
+		# solver exactly on those boundaries, so clamp to the last valid row
+		idx = int((t % (n*closure_length))/closure_length)
+		return min(idx, n - 1)
+	return 0
+
+
+# signal for all n patches at once -- same logic as square_signal_jit but with a
+# boolean mask over regions instead of a per-region call
+def square_signal_all(t, closure_length, m, n, poaching, mgmt_strat = 'periodic'):
+	regions = np.arange(n)
+	open_val = open_fishing_value(m, n, poaching) if m != n else poaching
+	if MGMT_CODES.get(mgmt_strat, 0) == 0:
+		if closure_length != 0:
 			start = int((t % (n*closure_length))/closure_length)
 		else:
 			start = 0
+		if start + m - 1 >= n:
+			# closed block wraps around past patch n-1
+			end = (start + m - 1) % n
+			closed = (regions >= start) | (regions <= end)
+		else:
+			end = start + m - 1 # may be -1 when m == 0 -> nothing closed
+			closed = (regions >= start) & (regions <= end)
+	else: # MPA
+		if m == 0:
+			return np.ones(n)
+		closed = regions <= m
+	return np.where(closed, poaching, open_val)
 
-		if start+m-1 >= n:
-
-			end = (start + m - 1)%n
 
-		else:
+# pure-math version of the signal so it can run inside the compiled RHS
+# (mgmt_code: 0 = periodic, 1 = MPA)
+@njit(cache = True, fastmath = True)
+def square_signal_jit(t, closure_length, region, m, n, poaching, mgmt_code):
 
-			end = (start + m - 1)
-		# print("START: ", start)
-		# print("END: ", end)
-		# print("REGION NUM ", region)
+	if mgmt_code == 0:
 
+		if closure_length != 0: 
 
-		# if region is closed (between start region and end region, inclusive), then we only have poaching
-		if region >= start and region <= end:
-			return poaching
-		elif start + m - 1 >= n and (region >= start or region <= end):
-			return poaching
+			start = int((t % (n*closure_length))/closure_length)
 		else:
-			# if region is open:
-			return (1-(m/n)*poaching)/(1 - (m/n))
+			start = 0
+
+		# branchless membership test for the closed block [start, start+m-1] mod n:
+		# when the block doesn't wrap, last < n and the first term decides; when it
+		# wraps past patch n-1, region <= last always holds so the first term reduces
+		# to region >= start and the second term adds the wrapped tail
+		last = start + m - 1
+		closed = ((region >= start) & (region <= last)) | ((last >= n) & (region <= last % n))
+		open_val = open_fishing_value(m, n, poaching) if m != n else poaching
+		return closed*poaching + (1 - closed)*open_val
 
-	elif mgmt_strat == 'MPA':
+	else: # MPA
 		if m == 0:
 			return 1 # if we close nothing, signal does not modify fishing intensity
 		if m == n:
 			return poaching # if we close everything, only poaching remains  
-		if region <= m:
-			return poaching  # closed region 
-		else: 
-			return (1 - (m / n) * poaching) / (1 - (m/n)) # open region 
+		closed = region <= m
+		return closed*poaching + (1 - closed)*open_fishing_value(m, n, poaching)
 
 	
+@njit(cache = True, fastmath = True)
 def sigmoid_signal(t, period, p):
 	if period == 0:
 		return 0
@@ -1131,40 +1482,49 @@ def sigmoid_signal(t, period, p):
 		return 1.0 / (1 + math.exp(-(t % period - p * period)))
 
 # fishing density dependence 
+@njit(cache = True, fastmath = True)
 def fishing(parrotfish, f):
 	steepness = 25
 	shift = 0.2
 	return f/(1+math.exp(-steepness*(parrotfish-shift)))
 
 
-def blackwood(X, t, i, system_model, P_influx):
-	
-	P, C, M = X.reshape(3, system_model.n)
-
-	# dP = s*P[i]*(1 - (P[i] / (beta*system_model.K(C[i])))) - system_model.fishing(P[i], f)*P[i]*system_model.square_signal(t, closure_length, i, m, n, poaching)
-	dP = P_influx[i] + system_model.s*P[i]*(1 - (P[i] / (system_model.beta*BMK(C[i])))) - system_model.f*P[i]*square_signal(t, system_model.closure_length, i, system_model.m, system_model.n, system_model.poaching, system_model.mgmt_strat)
-	dC = system_model.r*(1-M[i]-C[i])*C[i]-system_model.d*C[i] - system_model.a*M[i]*C[i] + 0.0005*system_model.i_C*(1-M[i]-C[i])
-	# need to define g(P) before this model is used 
-	dM = system_model.a*M[i]*C[i] - system_model.alpha*P[i]/system_model.beta*M[i] *(1/(1-C[i])) + system_model.gamma*M[i]*(1-M[i]-C[i]) + 0.0075*system_model.i_M*(1-M[i]-C[i])
-
-	# return np.concatenate((dPs, dCs, dMs), axis=0)
-	return [dP, dC, dM]
-	
+# run every compiled function once on tiny single-patch inputs so numba pays its
+# compilation cost here at import, not in the middle of the first sweep
+def warm_up_jit():
+	kP1 = np.zeros((1, 1))
+	kP1.flags.writeable = False # the real kP comes frozen from dispersal_matrix --
+	# warm with the same readonly type or numba compiles a second signature anyway
+	sig1 = np.ones((1, 1)) # single-patch signal table
+	vdl = (1, kP1, 0.0, 1.0, 0.5, 0.3, 0.05, 0.05, 0.1, 0.8, 1.0, 2.0, 0.5, 0.1, 1.0, 0, 0.0, 0, sig1)
+	bm = (1, kP1, 0.0, 1.0, 1.0, 1.0, 0.44, 0.1, 0.05, 0.05, 0.8, 1.0, 0.1, 1.0, 0, 0.0, 0, sig1)
+	rb = (1, kP1, 0.0, 1.0, 20.0, 0.58, 0.001, 0.0001, 0.5, 0.1, 0.2, 0.4, 0.4, 2.0, 0.05, 0.4, 0.4, 0.1, 1.0, 0, 0.0, 0, sig1)
+	X3 = np.full(3, 0.1)
+	X4 = np.full(4, 0.1)
+	leemput_rhs(X3, 0.0, vdl, np.empty(3))
+	blackwood_rhs(X3, 0.0, bm, np.empty(3))
+	rass_briggs_rhs(X4, 0.0, rb, np.empty(4))
+	leemput_jac(X3, 0.0, vdl)
+	blackwood_jac(X3, 0.0, bm)
+	rass_briggs_jac(X4, 0.0, rb)
+
+
+if HAVE_NUMBA:
+	warm_up_jit()
+
+
+# one scenario_plot run in its own process -- builds a fresh Model inside the worker
+# so the task tuple holds only plain scalars/tuples and stays pickleable
+def run_scenario(task):
+	model_type, n, frac_nomove, fish_growth_rate, yrs, fishing_midpoint, ic_name, ics, filename, show_legend, poaching = task
+	model = Model(model_type, n, frac_nomove, mgmt_strat = 'periodic')
+	model.initialize_patch_model(*ics)
+	model.load_parameters(fish_growth_rate)
+	model.set_mgmt_params(0, 0, 0, poaching) # scenario_plot sets everything else itself
+	t = time_grid(yrs)
+	IC_set = model.X1 if ic_name == 'X1' else model.X2
+	model.scenario_plot(t, fishing_midpoint, IC_set, filename = filename, show_legend = show_legend)
 
-# will need to pass [self.P, self.C, self.M] to this for it to work 
-def leemput(X, t, i, system_model, P_influx): 
-  # check input 
-  P,C,M = X.reshape(3, system_model.n) 
-  # dC = P_influx[i]+ system_model.s*P[i]*(1 - (P[i] / K(system_model.sigma,C[i]))) - fishing(P[i], system_model.f)*P[i] *(square_signal(t, system_model.closure_length, i, system_model.m, system_model.n, system_model.poaching))
-
-  dP = P_influx[i]+ system_model.s*P[i]*(1 - (P[i] / K(system_model.sigma,C[i]))) - system_model.f*P[i]*(square_signal(t, system_model.closure_length, i, system_model.m, system_model.n, system_model.poaching, system_model.mgmt_strat))
-  # print(P_influx)
-  # print(square_signal(t, system_model.closure_length, i, system_model.m, system_model.n, system_model.poaching))
-  dC = (system_model.i_C + system_model.r*C[i])*(1-M[i]-C[i])*(1-system_model.alpha*M[i]) - system_model.d*C[i]
-  dM = (system_model.i_M+system_model.gamma*M[i])*(1-M[i]-C[i]) - system_model.g*M[i]*P[i]/(system_model.g*system_model.eta*M[i]+1)
-  # couldd make yield an extra state variable ? but this is passsed to the solver...
-  return [dP, dC, dM]
-  
 
 def main():
   
@@ -1185,12 +1545,12 @@ def main():
   
   # time 
   yrs = 500 #total amount of time
-  t = np.linspace(0, yrs, yrs) #timestep array -- same number of timesteps as years 
+  t = T_DEFAULT #timestep array -- same number of timesteps as years 
   
   # BM_yrs = 0
   
   RB_yrs = 12000 #total amount of time -- changed from 3000 for runtime...
-  RB_t = np.linspace(0, RB_yrs, RB_yrs) #timestep array -- same number of timesteps as years 
+  RB_t = T_RB #timestep array -- same number of timesteps as years 
   
   
   # initial conditions 
@@ -1223,90 +1583,22 @@ def main():
   rass_briggs.initialize_patch_model(P0_RB, C0L, C0H, M0vL, M0vH, M0iL, M0iH)
  
 
-  van_de_leemput.load_parameters(2)
-  rass_briggs.load_parameters(2)
-  blackwood_mumby.load_parameters(2)
+  for mdl in (van_de_leemput, rass_briggs, blackwood_mumby):
+    mdl.load_parameters(2)
   
-  #van_de_leemput.bistable_zone(t)
-  #rass_briggs.bistable_zone(t)
-  # blackwood_mumby.bistable_zone(t)
 
-  #van_de_leemput.set_mgmt_params(100, vdl_fishing_midpoint,3, 0) # set closure duration, fishing level, number of closures, and poaching, in that order 
-  #van_de_leemput.time_series(van_de_leemput.X2, t, save = False, show = True) 
   #quit()
   
-  van_de_leemput.load_parameters(2)
-  rass_briggs.load_parameters(2)
-  blackwood_mumby.load_parameters(2)
-  
-  #van_de_leemput.bistable_zone(t)
-  #rass_briggs.bistable_zone(t)
   blackwood_mumby.bistable_zone(t)
  
-  # blackwood_mumby.initialize_patch_model(0.1, C0L, 0.7, 0.02, M0H)
-  # van_de_leemput.initialize_patch_model(P0, C0L, C0H, M0L, M0H)
-  # rass_briggs.initialize_patch_model(P0_RB, C0L, 0.5, M0vL, M0vH, M0iL, M0iH)
   
-  vdl_MP.load_parameters()
-  vdl_PC.load_parameters()
-  vdl_MC.load_parameters()
+  for mdl in (vdl_MP, vdl_PC, vdl_MC):
+    mdl.load_parameters()
   van_de_leemput.load_parameters(1)
   rass_briggs.load_parameters(0.49)
   blackwood_mumby.load_parameters(0.49)
 
-  # van_de_leemput.bistable_zone(t, 'vdL_Bistable_zone')
-  # rass_briggs.bistable_zone(t, 'RB_Bistable_zone')
-  # blackwood_mumby.bistable_zone(t, 'BM_Bistable_zone')
-  '''
-  van_de_leemput.load_parameters(1)
-  rass_briggs.load_parameters(0.49)
-  blackwood_mumby.load_parameters(0.49)
-
-  van_de_leemput.bistable_zone(t)
-  rass_briggs.bistable_zone(t)
-  blackwood_mumby.bistable_zone(t)
-  
-  van_de_leemput.load_parameters(0.5)
-  rass_briggs.load_parameters(0.5)
-  blackwood_mumby.load_parameters(0.5)
-
-  # blackwood_mumby.set_mgmt_params(30, BM_fishing_midpoint,3, 0) # set closure duration, fishing level, number of closures, and poaching, in that order 
-  # blackwood_mumby.time_series(blackwood_mumby.X2, t, save = False, show = True) 
-  van_de_leemput.set_mgmt_params(100, vdl_fishing_midpoint,3, 0) # set closure duration, fishing level, number of closures, and poaching, in that order 
-  van_de_leemput.time_series(van_de_leemput.X2, t, save = False, show = True) 
-  
-  van_de_leemput.bistable_zone(t)
-  rass_briggs.bistable_zone(t)
-  blackwood_mumby.bistable_zone(t)
-  
-  van_de_leemput.load_parameters(1)
-  rass_briggs.load_parameters(1)
-  blackwood_mumby.load_parameters(1)
-  
-  van_de_leemput.bistable_zone(t)
-  rass_briggs.bistable_zone(t)
-  blackwood_mumby.bistable_zone(t)
-  
-  van_de_leemput.load_parameters(0.25)
-  rass_briggs.load_parameters(0.25)
-  blackwood_mumby.load_parameters(0.25)
-  
-  van_de_leemput.bistable_zone(t)
-  rass_briggs.bistable_zone(t)
-  blackwood_mumby.bistable_zone(t)
-  
-  van_de_leemput.load_parameters(2)
-  rass_briggs.load_parameters(2)
-  blackwood_mumby.load_parameters(2)
-  
-  van_de_leemput.bistable_zone(t)
-  rass_briggs.bistable_zone(t)
-  blackwood_mumby.bistable_zone(t)
-  eld
-  '''
-
 
-    
   van_de_leemput.load_parameters(1)
   rass_briggs.load_parameters(0.5)
   blackwood_mumby.load_parameters(2)
@@ -1318,123 +1610,59 @@ def main():
   vdl_MC_crt = vdl_MC.get_coral_recovery_time(t)
   vdl_PC_crt = vdl_PC.get_coral_recovery_time(t)
 
-  # blackwood_mumby.set_mgmt_params(20, BM_fishing_midpoint,5, 0) # set closure duration, fishing level, number of closures, and poaching, in that order 
-  # blackwood_mumby.time_series(blackwood_mumby.X2, t, save = False, show = True) 
-
 
-  
-
-  # vdl_MC.bistable_zone(t, filename = 'MCBistableZone')
- # vdl_PC.bistable_zone(t, filename = 'PCBistableZone')
-  # vdl_MP.bistable_zone(t, filename = 'MPBistableZone')
-
-  # ICs = van_de_leemput.X1
-  # van_de_leemput.scenario_plot(t, vdl_fishing_midpoint, ICs, filename = 'December5_FishGrowth0.5_vdL_FivePercentDispersal_StartingLow')
   ICs = van_de_leemput.X1
   van_de_leemput.yield_scenario_plot(t, vdl_fishing_midpoint, ICs, filename = 'YIELD_December30_FishGrowth0.5_vdL_FivePercentDispersal_StartingLow')
   
-  # FISH GROWTH RATE = 0.
-  ICs = van_de_leemput.X1
-  van_de_leemput.scenario_plot(t, vdl_fishing_midpoint, ICs, filename = 'December5_FishGrowth0.5_vdL_FivePercentDispersal_StartingLow')
-  ICs = van_de_leemput.X2
-  van_de_leemput.scenario_plot(t, vdl_fishing_midpoint, ICs, filename = 'December5_FishGrowth0.5_vdL_FivePercentDispersal_StartingHigh', show_legend = True)
-  ICs = rass_briggs.X2
-  rass_briggs.scenario_plot(RB_t, RB_fishing_midpoint, ICs, filename = 'December5_FishGrowth0.5_RB_FivePercentDispersal_StartingHigh')
-  ICs = rass_briggs.X1
-  rass_briggs.scenario_plot(RB_t, RB_fishing_midpoint, ICs, filename = 'December5_FishGrowth0.5_RB_FivePercentDispersal_StartingLow')
-  ICs = blackwood_mumby.X1
-  blackwood_mumby.scenario_plot(t, BM_fishing_midpoint, ICs, filename = 'December5_FishGrowth0.5_BM_FivePercentDispersal_StartingLow')
-  ICs = blackwood_mumby.X2
-  blackwood_mumby.scenario_plot(t, BM_fishing_midpoint, ICs, filename = 'December5_FishGrowth0.5_BM_FivePercentDispersal_StartingLow')
-  
-  
-  
-  van_de_leemput.load_parameters(1)
-  rass_briggs.load_parameters(1)
-  blackwood_mumby.load_parameters(1)
-  
-   # FISH GROWTH RATE = 1
-  ICs = van_de_leemput.X1
-  van_de_leemput.scenario_plot(t, vdl_fishing_midpoint, ICs, filename = 'December5_FishGrowth1_vdL_FivePercentDispersal_StartingLow')
-  ICs = van_de_leemput.X2
-  van_de_leemput.scenario_plot(t, vdl_fishing_midpoint, ICs, filename = 'December5_FishGrowth1_vdL_FivePercentDispersal_StartingHigh', show_legend = True)
-  ICs = rass_briggs.X2
-  rass_briggs.scenario_plot(RB_t, RB_fishing_midpoint, ICs, filename = 'December5_FishGrowth1_RB_FivePercentDispersal_StartingHigh')
-  ICs = rass_briggs.X1
-  rass_briggs.scenario_plot(RB_t, RB_fishing_midpoint, ICs, filename = 'December5_FishGrowth1_RB_FivePercentDispersal_StartingLow')
-  ICs = blackwood_mumby.X1
-  blackwood_mumby.scenario_plot(t, BM_fishing_midpoint, ICs, filename = 'December5_FishGrowth1_BM_FivePercentDispersal_StartingLow')
-  ICs = blackwood_mumby.X2
-  blackwood_mumby.scenario_plot(t, BM_fishing_midpoint, ICs, filename = 'December5_FishGrowth1_BM_FivePercentDispersal_StartingHigh')
-  
-  
-  van_de_leemput.load_parameters(2)
-  rass_briggs.load_parameters(2)
-  blackwood_mumby.load_parameters(2)
-  
-  # FISH GROWTH RATE = 2
-  ICs = van_de_leemput.X1
-  van_de_leemput.scenario_plot(t, vdl_fishing_midpoint, ICs, filename = 'December5_FishGrowth2_vdL_FivePercentDispersal_StartingLow')
-  ICs = van_de_leemput.X2
-  van_de_leemput.scenario_plot(t, vdl_fishing_midpoint, ICs, filename = 'December5_FishGrowth2_vdL_FivePercentDispersal_StartingHigh', show_legend = True)
-  ICs = rass_briggs.X2
-  rass_briggs.scenario_plot(RB_t, RB_fishing_midpoint, ICs, filename = 'December5_FishGrowth2_RB_FivePercentDispersal_StartingHigh')
-  ICs = rass_briggs.X1
-  rass_briggs.scenario_plot(RB_t, RB_fishing_midpoint, ICs, filename = 'December5_FishGrowth2_RB_FivePercentDispersal_StartingLow')
-  ICs = blackwood_mumby.X1
-  blackwood_mumby.scenario_plot(t, BM_fishing_midpoint, ICs, filename = 'December5_FishGrowth2_BM_FivePercentDispersal_StartingLow')
-  ICs = blackwood_mumby.X2
-  blackwood_mumby.scenario_plot(t, BM_fishing_midpoint, ICs, filename = 'December5_FishGrowth2_BM_FivePercentDispersal_StartingHigh')
-  
-  
+  # FISH GROWTH RATE sweep (0.5, 1, 2, 0.25) -- every scenario_plot here is an
+  # independent set of integrations, so farm the whole sweep out to a process pool
+  vdl_ics = (P0, C0L, C0H, M0L, M0H)
+  rb_ics = (P0_RB, C0L, C0H, M0vL, M0vH, M0iL, M0iH)
+  tasks = []
+  for fgr in [0.5, 1, 2, 0.25]:
+    tag = 'December5_FishGrowth' + str(fgr) + '_'
+    bm_high = 'StartingLow' if fgr == 0.5 else 'StartingHigh' # the 0.5 block reused the Low name
+    tasks.append(('vdL', 8, 0.95, fgr, yrs, vdl_fishing_midpoint, 'X1', vdl_ics, tag + 'vdL_FivePercentDispersal_StartingLow', False, 0))
+    tasks.append(('vdL', 8, 0.95, fgr, yrs, vdl_fishing_midpoint, 'X2', vdl_ics, tag + 'vdL_FivePercentDispersal_StartingHigh', True, 0))
+    tasks.append(('RB', 12, 0.95, fgr, RB_yrs, RB_fishing_midpoint, 'X2', rb_ics, tag + 'RB_FivePercentDispersal_StartingHigh', False, 0))
+    tasks.append(('RB', 12, 0.95, fgr, RB_yrs, RB_fishing_midpoint, 'X1', rb_ics, tag + 'RB_FivePercentDispersal_StartingLow', False, 0))
+    if fgr != 0.5:
+      # at 0.5 the X2 task reuses the StartingLow name (above), so the X1 plot was
+      # always overwritten when these ran serially -- don't race two workers on the
+      # same file, just skip the write that was never observable
+      tasks.append(('BM', 12, 0.95, fgr, yrs, BM_fishing_midpoint, 'X1', vdl_ics, tag + 'BM_FivePercentDispersal_StartingLow', False, 0))
+    tasks.append(('BM', 12, 0.95, fgr, yrs, BM_fishing_midpoint, 'X2', vdl_ics, tag + 'BM_FivePercentDispersal_' + bm_high, False, 0))
+  # loky gives each worker a fresh interpreter, so matplotlib state in one
+  # scenario can't bleed into another the way forked Pool workers allow
+  Parallel(n_jobs = -1, backend = 'loky')(delayed(run_scenario)(task) for task in tasks)
+
+  # the sweep used to leave the models loaded at the last growth rate -- keep that
+  # so everything downstream sees the same parameters as before
   van_de_leemput.load_parameters(0.25)
   rass_briggs.load_parameters(0.25)
   blackwood_mumby.load_parameters(0.25)
   
-  # FISH GROWTH RATE = 0.25
-  ICs = van_de_leemput.X1
-  van_de_leemput.scenario_plot(t, vdl_fishing_midpoint, ICs, filename = 'December5_FishGrowth0.25_vdL_FivePercentDispersal_StartingLow')
-  ICs = van_de_leemput.X2
-  van_de_leemput.scenario_plot(t, vdl_fishing_midpoint, ICs, filename = 'December5_FishGrowth0.25_vdL_FivePercentDispersal_StartingHigh', show_legend = True)
-  ICs = rass_briggs.X2
-  rass_briggs.scenario_plot(RB_t, RB_fishing_midpoint, ICs, filename = 'December5_FishGrowth0.25_RB_FivePercentDispersal_StartingHigh')
-  ICs = rass_briggs.X1
-  rass_briggs.scenario_plot(RB_t, RB_fishing_midpoint, ICs, filename = 'December5_FishGrowth0.25_RB_FivePercentDispersal_StartingLow')
-  ICs = blackwood_mumby.X1
-  blackwood_mumby.scenario_plot(t, BM_fishing_midpoint, ICs, filename = 'December5_FishGrowth0.25_BM_FivePercentDispersal_StartingLow')
-  ICs = blackwood_mumby.X2
-  blackwood_mumby.scenario_plot(t, BM_fishing_midpoint, ICs, filename = 'December5_FishGrowth0.25_BM_FivePercentDispersal_StartingHigh')
-  
+  # each single-feedback variant plots both starting conditions in one call, so the
+  # recovery time / pool launch / MPA line work is shared per variant. Each uses its
+  # own X1/X2 (the default) -- the variants are 12-patch, so borrowing the 8-patch
+  # van_de_leemput ICs would hand the solver the wrong state size
+
   # parrotfish and coral feedback only (vdl PC)
-  ICs = van_de_leemput.X1
-  vdl_PC.scenario_plot(t, vdl_PC_fishing_midpoint, ICs, filename = 'December5_vdL_parrotfish_coral_FivePercentDispersal_StartingLow')
-  ICs = van_de_leemput.X2
-  vdl_PC.scenario_plot(t, vdl_PC_fishing_midpoint, ICs, filename = 'December5_vdL_parrotfish_coral_FivePercentDispersal_StartingHigh', show_legend = True)
+  vdl_PC.scenario_plot_pair(t, vdl_PC_fishing_midpoint,
+    filenames = ('December5_vdL_parrotfish_coral_FivePercentDispersal_StartingLow', 'December5_vdL_parrotfish_coral_FivePercentDispersal_StartingHigh'),
+    show_legends = (False, True))
 
   # algae and coral feedback only (vdl MC)
-  ICs = van_de_leemput.X1
-  vdl_MC.scenario_plot(t, vdl_MC_fishing_midpoint, ICs, filename = 'December5_vdL_algae_coral_FivePercentDispersal_StartingLow')
-  ICs = van_de_leemput.X2
-  vdl_MC.scenario_plot(t, vdl_MC_fishing_midpoint, ICs, filename = 'December5_vdL_algae_coral_FivePercentDispersal_StartingHigh')
+  vdl_MC.scenario_plot_pair(t, vdl_MC_fishing_midpoint,
+    filenames = ('December5_vdL_algae_coral_FivePercentDispersal_StartingLow', 'December5_vdL_algae_coral_FivePercentDispersal_StartingHigh'),
+    show_legends = (False, False))
 
   # algae and parrotfish feedback only (vdl MP)
-  ICs = van_de_leemput.X1
-  vdl_MP.scenario_plot(t, vdl_MP_fishing_midpoint, ICs, filename = 'December5_vdL_parrotfish_algae_FivePercentDispersal_StartingLow')
-  ICs = van_de_leemput.X2
-  vdl_MP.scenario_plot(t, vdl_MP_fishing_midpoint, ICs, filename = 'December5_vdL_parrotfish_algae_FivePercentDispersal_StartingHigh')
+  vdl_MP.scenario_plot_pair(t, vdl_MP_fishing_midpoint,
+    filenames = ('December5_vdL_parrotfish_algae_FivePercentDispersal_StartingLow', 'December5_vdL_parrotfish_algae_FivePercentDispersal_StartingHigh'),
+    show_legends = (False, False))
+
 
-  
-  
-  '''
-  rass_briggs.set_mgmt_params(2*RB_crt/12, RB_fishing_midpoint, 3, 0)
-  rass_briggs.time_series(rass_briggs.X2, RB_t, save = True, show = False)
-  rass_briggs.set_mgmt_params(2*RB_crt/12, RB_fishing_midpoint, 4, 0)
-  rass_briggs.time_series(rass_briggs.X2, RB_t, save = True, show = False) 
-  rass_briggs.set_mgmt_params(2*RB_crt/12, RB_fishing_midpoint, 5, 0)
-  rass_briggs.time_series(rass_briggs.X2, RB_t, save = True, show = False) 
-  rass_briggs.set_mgmt_params(2*RB_crt/12, RB_fishing_midpoint, 6, 0)
-  rass_briggs.time_series(rass_briggs.X2, RB_t, save = True, show = False) 
-  '''
   blackwood_mumby.set_mgmt_params(3/12*BM_crt, BM_fishing_midpoint,3, 0) # set closure duration, fishing level, number of closures, and poaching, in that order 
   blackwood_mumby.time_series(blackwood_mumby.X2, t, save = True, show = False) 
   blackwood_mumby.set_mgmt_params(BM_crt/12, BM_fishing_midpoint,3, 0) # set closure duration, fishing level, number of closures, and poaching, in that order 
@@ -1448,49 +1676,14 @@ def main():
   blackwood_mumby.set_mgmt_params(BM_crt/6, BM_fishing_midpoint,4, 0) # set closure duration, fishing level, number of closures, and poaching, in that order 
   blackwood_mumby.time_series(blackwood_mumby.X2, t, save = True, show = False) 
 
-  
-  
-  # rass_briggs.time_series(rass_briggs.X2, t, save = False, show = True) 
-  # rass_briggs.time_series(rass_briggs.X2, t, save = False, show = True) 
+
   # TIME SERIES
-  '''
-  blackwood_mumby.set_mgmt_params(.25/12*BM_crt, BM_fishing_midpoint,1, 0) # set closure duration, fishing level, number of closures, and poaching, in that order 
-  blackwood_mumby.time_series(blackwood_mumby.X2, t, save = True, show = False) 
-  blackwood_mumby.set_mgmt_params(BM_crt/12, BM_fishing_midpoint,2, 0) # set closure duration, fishing level, number of closures, and poaching, in that order 
-  blackwood_mumby.time_series(blackwood_mumby.X2, t, save = True, show = False) 
-  blackwood_mumby.set_mgmt_params(BM_crt/6, BM_fishing_midpoint,3, 0) # set closure duration, fishing level, number of closures, and poaching, in that order 
-  blackwood_mumby.time_series(blackwood_mumby.X2, t, save = True, show = False) 
-  print("PROGRESS CHECK")
-  
-  blackwood_mumby.set_mgmt_params(.1*BM_crt, BM_fishing_midpoint,4, 0) # set closure duration, fishing level, number of closures, and poaching, in that order 
-  blackwood_mumby.time_series(blackwood_mumby.X2, t, save = True, show = False) 
-  blackwood_mumby.set_mgmt_params(.1*BM_crt, BM_fishing_midpoint,5, 0) # set closure duration, fishing level, number of closures, and poaching, in that order 
-  blackwood_mumby.time_series(blackwood_mumby.X2, t, save = True, show = False) 
-  blackwood_mumby.set_mgmt_params(.1*BM_crt, BM_fishing_midpoint,6, 0) # set closure duration, fishing level, number of closures, and poaching, in that order 
-  blackwood_mumby.time_series(blackwood_mumby.X2, t, save = True, show = False) 
-  blackwood_mumby.set_mgmt_params(.1*BM_crt, BM_fishing_midpoint,7, 0) # set closure duration, fishing level, number of closures, and poaching, in that order 
-  blackwood_mumby.time_series(blackwood_mumby.X2, t, save = True, show = False) 
-  
-  blackwood_mumby.set_mgmt_params(.2*BM_crt, BM_fishing_midpoint,2, 0) # set closure duration, fishing level, number of closures, and poaching, in that order 
-  blackwood_mumby.time_series(blackwood_mumby.X2, t, save = True, show = False) 
-  blackwood_mumby.set_mgmt_params(.2*BM_crt, BM_fishing_midpoint,4, 0) # set closure duration, fishing level, number of closures, and poaching, in that order 
-  blackwood_mumby.time_series(blackwood_mumby.X2, t, save = True, show = False) 
-  blackwood_mumby.set_mgmt_params(.2*BM_crt, BM_fishing_midpoint,3, 0) # set closure duration, fishing level, number of closures, and poaching, in that order 
-  blackwood_mumby.time_series(blackwood_mumby.X2, t, save = True, show = False) 
-  '''
   
-  # rass_briggs.set_mgmt_params(1*RB_crt, RB_fishing_midpoint, 0, 0)
-  # rass_briggs.time_series(rass_briggs.X2, t, save = False, show = True) 
   
   van_de_leemput.set_mgmt_params(vdL_crt, vdl_fishing_midpoint, 1, 0)
-  # van_de_leemput.time_series(van_de_leemput.X1, t, save = True, show = False, show_legend = True) 
   
   van_de_leemput.set_mgmt_params(2.5*vdL_crt, vdl_fishing_midpoint, 1, 0)
-  # van_de_leemput.time_series(van_de_leemput.X1, t, save = True, show = False) 
   
-  # blackwood_mumby.bistable_zone(t, filename = '12patchSeptember28_BM_hysteresis')
-  # van_de_leemput.bistable_zone(t, filename = '12patchSeptember28_vdL_hysteresis')
-  # rass_briggs.bistable_zone(RB_t, filename = '12patchSeptember28_RB_hysteresis')
   
   blackwood_mumby = Model('BM', 30, 0.95, mgmt_strat = 'periodic') 
   van_de_leemput = Model('vdL', 30, 0.95, mgmt_strat = 'periodic')
@@ -1500,9 +1693,8 @@ def main():
   van_de_leemput.initialize_patch_model(P0, C0L, C0H, M0L, M0H)
   rass_briggs.initialize_patch_model(P0_RB, C0L, C0H, M0vL, M0vH, M0iL, M0iH)
   
-  van_de_leemput.load_parameters()
-  rass_briggs.load_parameters()
-  blackwood_mumby.load_parameters()
+  for mdl in (van_de_leemput, rass_briggs, blackwood_mumby):
+    mdl.load_parameters()
   
   print("Generating recovery heatmaps...")
   RB_yrs = 30 #total amount of time -- changed from 3000 for runtime...
@@ -1526,229 +1718,42 @@ def main():
   
   print("Generating scenario plots")
   # 99 percent do not disperse
-  blackwood_mumby = Model('BM', 12, 0.99, mgmt_strat = 'periodic') 
-  van_de_leemput = Model('vdL', 12, 0.99, mgmt_strat = 'periodic')
-  rass_briggs = Model('RB', 12, 0.99, mgmt_strat = 'periodic')
-  
-  blackwood_mumby.initialize_patch_model(P0, C0L, C0H, M0L, M0H)
-  van_de_leemput.initialize_patch_model(P0, C0L, C0H, M0L, M0H)
-  rass_briggs.initialize_patch_model(P0_RB, C0L, C0H, M0vL, M0vH, M0iL, M0iH)
-  
-  van_de_leemput.load_parameters()
-  rass_briggs.load_parameters()
-  blackwood_mumby.load_parameters()
-  
-  ICs = van_de_leemput.X1
-  van_de_leemput.scenario_plot(t, vdl_fishing_midpoint, ICs, filename = '12patch_September28_vdL_12patch_ScenarioPlot_2PercentDispersal_StartingLow')
-  ICs = van_de_leemput.X2
-  van_de_leemput.scenario_plot(t, vdl_fishing_midpoint, ICs, filename = '12patch_September28_vdL_12patch_ScenarioPlot_2PercentDispersal_StartingHigh', show_legend = True)
-  
-  ICs = rass_briggs.X2
-  rass_briggs.scenario_plot(RB_t, RB_fishing_midpoint, ICs, filename = '12patch_September28_RB_12patch_ScenarioPlot_2PercentDispersal_StartingHigh')
-  ICs = rass_briggs.X1
-  rass_briggs.scenario_plot(RB_t, RB_fishing_midpoint, ICs, filename = '12patch_September28_RB_12patch_ScenarioPlot_2PercentDispersal_StartingLow')
-  ICs = blackwood_mumby.X1
-  blackwood_mumby.scenario_plot(t, BM_fishing_midpoint, ICs, filename = '12patch_September28_BM_12patch_ScenarioPlot_2PercentDispersal_StartingLow')
-  ICs = blackwood_mumby.X2
-  blackwood_mumby.scenario_plot(t, BM_fishing_midpoint, ICs, filename = '12patch_September28_BM_12patch_ScenarioPlot_2PercentDispersal_StartingHigh')
+  # the September28 scenario sections below are independent of each other in the
+  # same way as the fish-growth sweep, so their plots are queued here and run as
+  # one parallel batch after the last section
+  sep_tasks = []
+
+  for ic, suffix, leg in (('X1', 'StartingLow', False), ('X2', 'StartingHigh', True)):
+    sep_tasks.append(('vdL', 12, 0.99, 1, yrs, vdl_fishing_midpoint, ic, vdl_ics, '12patch_September28_vdL_12patch_ScenarioPlot_2PercentDispersal_' + suffix, leg, 0))
+    sep_tasks.append(('RB', 12, 0.99, 1, RB_yrs*RB_crt, RB_fishing_midpoint, ic, rb_ics, '12patch_September28_RB_12patch_ScenarioPlot_2PercentDispersal_' + suffix, False, 0))
+    sep_tasks.append(('BM', 12, 0.99, 1, yrs, BM_fishing_midpoint, ic, vdl_ics, '12patch_September28_BM_12patch_ScenarioPlot_2PercentDispersal_' + suffix, False, 0))
    # 95 percent do not disperse, 30 patches, runnin three times longer than scenario plots 
   
   # 90 percent do not disperse
-  blackwood_mumby = Model('BM', 12, 0.9, mgmt_strat = 'periodic') 
-  van_de_leemput = Model('vdL', 12, 0.9, mgmt_strat = 'periodic')
-  rass_briggs = Model('RB', 12, 0.9, mgmt_strat = 'periodic')
-  
-  blackwood_mumby.initialize_patch_model(P0, C0L, C0H, M0L, M0H)
-  van_de_leemput.initialize_patch_model(P0, C0L, C0H, M0L, M0H)
-  rass_briggs.initialize_patch_model(P0, C0L, 0.6, M0vL, M0vH, M0iL, M0iH)
-  
-  van_de_leemput.load_parameters()
-  rass_briggs.load_parameters()
-  blackwood_mumby.load_parameters()
-  
-  ICs = van_de_leemput.X1
-  van_de_leemput.scenario_plot(t, vdl_fishing_midpoint, ICs, filename = 'September28_vdL_12patch_ScenarioPlot_10PercentDispersal_StartingLow')
-  ICs = van_de_leemput.X2
-  van_de_leemput.scenario_plot(t, vdl_fishing_midpoint, ICs, filename = 'September28_vdL_12patch_ScenarioPlot_10PercentDispersal_StartingHigh', show_legend = True)
-  
-  ICs = rass_briggs.X2
-  rass_briggs.scenario_plot(RB_t, RB_fishing_midpoint, ICs, filename = 'September28_fixedRB_12patch_ScenarioPlot_10PercentDispersal_StartingHigh')
-  ICs = rass_briggs.X1
-  rass_briggs.scenario_plot(RB_t, RB_fishing_midpoint, ICs, filename = 'September28_fixedRB_12patch_ScenarioPlot_10PercentDispersal_StartingLow')
-  ICs = blackwood_mumby.X1
-  blackwood_mumby.scenario_plot(t, BM_fishing_midpoint, ICs, filename = 'September28_BM_12patch_ScenarioPlot_10PercentDispersal_StartingLow')
-  ICs = blackwood_mumby.X2
-  blackwood_mumby.scenario_plot(t, BM_fishing_midpoint, ICs, filename = 'September28_BM_12patch_ScenarioPlot_10PercentDispersal_StartingHigh')
+  for ic, suffix, leg in (('X1', 'StartingLow', False), ('X2', 'StartingHigh', True)):
+    sep_tasks.append(('vdL', 12, 0.9, 1, yrs, vdl_fishing_midpoint, ic, vdl_ics, 'September28_vdL_12patch_ScenarioPlot_10PercentDispersal_' + suffix, leg, 0))
+    sep_tasks.append(('RB', 12, 0.9, 1, RB_yrs*RB_crt, RB_fishing_midpoint, ic, (P0, C0L, 0.6, M0vL, M0vH, M0iL, M0iH), 'September28_fixedRB_12patch_ScenarioPlot_10PercentDispersal_' + suffix, False, 0))
+    sep_tasks.append(('BM', 12, 0.9, 1, yrs, BM_fishing_midpoint, ic, vdl_ics, 'September28_BM_12patch_ScenarioPlot_10PercentDispersal_' + suffix, False, 0))
 
      # 95 percent do not disperse, 30 patches, runnin three times longer than scenario plots 
 
  
-  blackwood_mumby = Model('BM', 12, 0.95, mgmt_strat = 'periodic')
-  van_de_leemput = Model('vdL', 12, 0.95, mgmt_strat = 'periodic')
-  rass_briggs = Model('RB', 12, 0.95, mgmt_strat = 'periodic')
-  
-  
- 
-  blackwood_mumby.initialize_patch_model(P0, C0L, C0H, M0L, M0H)
-  van_de_leemput.initialize_patch_model(P0, C0L, C0H, M0L, M0H)
-  rass_briggs.initialize_patch_model(P0_RB, C0L, 0.6, M0vL, M0vH, M0iL, M0iH)
-  
-  van_de_leemput.load_parameters()
-  rass_briggs.load_parameters()
-  blackwood_mumby.load_parameters()
-
-  
-  van_de_leemput.set_mgmt_params(closure_length = 35, f = 0, m = 1, poaching =  0)
-  blackwood_mumby.set_mgmt_params(closure_length = 35, f = 0, m = 1, poaching =  0)
-  rass_briggs.set_mgmt_params(closure_length = 35, f = 0, m = 1, poaching =  0)
-  
-   # JUMP 
-  
-  ICs = van_de_leemput.X1
-  van_de_leemput.scenario_plot(t, vdl_fishing_midpoint, ICs, filename = 'September28_vdL_12patch_ScenarioPlot_FivePercentDispersal_StartingLow')
-  ICs = van_de_leemput.X2
-  van_de_leemput.scenario_plot(t, vdl_fishing_midpoint, ICs, filename = 'September28_vdL_12patch_ScenarioPlot_FivePercentDispersal_StartingHigh', show_legend = True)
- 
-  ICs = blackwood_mumby.X2
-  blackwood_mumby.scenario_plot(t, BM_fishing_midpoint, ICs, filename = 'September28_BM_12patch_ScenarioPlot_FivePercentDispersal_StartingHigh')
-  ICs = rass_briggs.X1
-  rass_briggs.scenario_plot(RB_t, RB_fishing_midpoint, ICs, filename = 'September28_fixedRB_12patch_ScenarioPlot_FivePercentDispersal_StartingLow')
-  ICs = rass_briggs.X2
-  rass_briggs.scenario_plot(RB_t, RB_fishing_midpoint, ICs, filename = 'September28_fixedRB_12patch_ScenarioPlot_FivePercentDispersal_StartingHigh')
-  ICs = blackwood_mumby.X1
-  blackwood_mumby.scenario_plot(t, BM_fishing_midpoint, ICs, filename = 'September28_BM_12patch_ScenarioPlot_FivePercentDispersal_StartingLow')
+  for ic, suffix, leg in (('X1', 'StartingLow', False), ('X2', 'StartingHigh', True)):
+    sep_tasks.append(('vdL', 12, 0.95, 1, yrs, vdl_fishing_midpoint, ic, vdl_ics, 'September28_vdL_12patch_ScenarioPlot_FivePercentDispersal_' + suffix, leg, 0))
+    sep_tasks.append(('RB', 12, 0.95, 1, RB_yrs*RB_crt, RB_fishing_midpoint, ic, (P0_RB, C0L, 0.6, M0vL, M0vH, M0iL, M0iH), 'September28_fixedRB_12patch_ScenarioPlot_FivePercentDispersal_' + suffix, False, 0))
+    sep_tasks.append(('BM', 12, 0.95, 1, yrs, BM_fishing_midpoint, ic, vdl_ics, 'September28_BM_12patch_ScenarioPlot_FivePercentDispersal_' + suffix, False, 0))
   
   # 95 percent dispersal with 20% poaching
-  blackwood_mumby = Model('BM', 12, 0.95, mgmt_strat = 'periodic') 
-  van_de_leemput = Model('vdL', 12, 0.95, mgmt_strat = 'periodic')
-  rass_briggs = Model('RB', 12, 0.95, mgmt_strat = 'periodic')
-  
- 
-  blackwood_mumby.initialize_patch_model(P0, C0L, C0H, M0L, M0H) # adding 0.2 for bug ? april 18
-  van_de_leemput.initialize_patch_model(P0, C0L, C0H, M0L, M0H)
-  rass_briggs.initialize_patch_model(P0_RB, C0L, 0.6, M0vL, M0vH, M0iL, M0iH)
-  
-  van_de_leemput.load_parameters()
-  rass_briggs.load_parameters()
-  blackwood_mumby.load_parameters()
-  
-  van_de_leemput.set_mgmt_params(closure_length = 35, f = 0, m = 1, poaching =  0.2)
-  blackwood_mumby.set_mgmt_params(closure_length = 35, f = 0, m = 1, poaching =  0.2)
-  rass_briggs.set_mgmt_params(closure_length = 35, f = 0, m = 1, poaching =  0.2)
-  
-  
-  ICs = van_de_leemput.X1
-  van_de_leemput.scenario_plot(t, vdl_fishing_midpoint, ICs, filename = 'September28_vdL_12patch_PoachingScenarioPlot_FivePercentDispersal_StartingLow')
-  ICs = van_de_leemput.X2
-  van_de_leemput.scenario_plot(t, vdl_fishing_midpoint, ICs, filename = 'September28_vdL_12patch_PoachingScenarioPlot_FivePercentDispersal_StartingHigh', show_legend = True)
- 
-  ICs = blackwood_mumby.X2
-  blackwood_mumby.scenario_plot(t, BM_fishing_midpoint, ICs, filename = 'September28_BM_12patch_PoachingScenarioPlot_FivePercentDispersal_StartingHigh')
-  ICs = rass_briggs.X1
-  rass_briggs.scenario_plot(RB_t, RB_fishing_midpoint, ICs, filename = 'September28_fixedRB_12patch_PoachingScenarioPlot_FivePercentDispersal_StartingLow')
-  ICs = rass_briggs.X2
-  rass_briggs.scenario_plot(RB_t, RB_fishing_midpoint, ICs, filename = 'September28_fixedRB_12patch_PoachingScenarioPlot_FivePercentDispersal_StartingHigh')
-  ICs = blackwood_mumby.X1
-  blackwood_mumby.scenario_plot(t, BM_fishing_midpoint, ICs, filename = 'September28_BM_12patch_PoachingScenarioPlot_FivePercentDispersal_StartingLow')
-  
-  van_de_leemput.set_mgmt_params(closure_length = 35, f = 0, m = 1, poaching =  0)
-  blackwood_mumby.set_mgmt_params(closure_length = 35, f = 0, m = 1, poaching =  0)
-  rass_briggs.set_mgmt_params(closure_length = 35, f = 0, m = 1, poaching =  0)
-  
-  
-  
- 
-  
-  # 75 percent do not disperse
-  blackwood_mumby = Model('BM', 12, 0.75, mgmt_strat = 'periodic') 
-  van_de_leemput = Model('vdL', 12, 0.75, mgmt_strat = 'periodic')
-  rass_briggs = Model('RB', 12, 0.75, mgmt_strat = 'periodic')
-  
- 
-  blackwood_mumby.initialize_patch_model(P0 + 0.2, C0L, C0H+ 0.2, M0L, M0H) # adding 0.2 for bug ? april 18
-  van_de_leemput.initialize_patch_model(P0, C0L, C0H, M0L, M0H)
-  rass_briggs.initialize_patch_model(P0_RB, C0L, 0.6, M0vL, M0vH, M0iL, M0iH)
-  
-  van_de_leemput.load_parameters()
-  rass_briggs.load_parameters()
-  blackwood_mumby.load_parameters()
-  
-  ICs = van_de_leemput.X1
-  # van_de_leemput.scenario_plot(t, vdl_fishing_midpoint, ICs, filename = '12patchSeptember28_Apr25_vdL_12patch_ScenarioPlot_25Dispersal_StartingLow')
-  ICs = van_de_leemput.X2
-  # van_de_leemput.scenario_plot(t, vdl_fishing_midpoint, ICs, filename = '12patchSeptember28_Apr25_vdL_12patch_ScenarioPlot_25Dispersal_StartingHigh', show_legend = True)
-  
-  ICs = rass_briggs.X2
-  #rass_briggs.scenario_plot(RB_t, RB_fishing_midpoint, ICs, filename = '12patchSeptember28_fixedRB_12patch_ScenarioPlot_25Dispersal_StartingHigh')
-  ICs = rass_briggs.X1
-  #rass_briggs.scenario_plot(RB_t, RB_fishing_midpoint, ICs, filename = '12patchSeptember28_fixedRB_12patch_ScenarioPlot_25Dispersal_StartingLow')
-  ICs = blackwood_mumby.X1
-  # blackwood_mumby.scenario_plot(t, BM_fishing_midpoint, ICs, filename = '12patchSeptember28_Apr25_BM_12patch_ScenarioPlot_25Dispersal_StartingLow')
-  ICs = blackwood_mumby.X2
-  # blackwood_mumby.scenario_plot(t, BM_fishing_midpoint, ICs, filename = '12patchSeptember28_Apr25_BM_12patch_ScenarioPlot_25Dispersal_StartingHigh')
-  
-   
-  # 98 percent do not disperse
-  blackwood_mumby = Model('BM', 12, 0.9, mgmt_strat = 'periodic') 
-  van_de_leemput = Model('vdL', 12, 0.9, mgmt_strat = 'periodic')
-  rass_briggs = Model('RB', 12, 0.9, mgmt_strat = 'periodic')
-  
-  blackwood_mumby.initialize_patch_model(P0 + 0.2, C0L, C0H + 0.2, M0L, M0H)
-  van_de_leemput.initialize_patch_model(P0, C0L, C0H, M0L, M0H)
-  rass_briggs.initialize_patch_model(P0_RB, C0L, 0.6, M0vL, M0vH, M0iL, M0iH)
-  
-  van_de_leemput.load_parameters()
-  rass_briggs.load_parameters()
-  blackwood_mumby.load_parameters()
-  
-  ICs = van_de_leemput.X1
-  # van_de_leemput.scenario_plot(t, vdl_fishing_midpoint, ICs, filename = '12patchSeptember28_Apr25_vdL_12patch_ScenarioPlot_98Dispersal_StartingLow')
-  ICs = van_de_leemput.X2
-  # van_de_leemput.scenario_plot(t, vdl_fishing_midpoint, ICs, filename = '12patchSeptember28_Apr25_vdL_12patch_ScenarioPlot_98Dispersal_StartingHigh', show_legend = True)
-  
-  ICs = rass_briggs.X2
-  #rass_briggs.scenario_plot(RB_t, RB_fishing_midpoint, ICs, filename = '12patchSeptember28_fixedRB_12patch_ScenarioPlot_TenPercentDispersal_StartingHigh')
-  ICs = rass_briggs.X1
-  #rass_briggs.scenario_plot(RB_t, RB_fishing_midpoint, ICs, filename = '12patchSeptember28_fixedRB_12patch_ScenarioPlot_TenPercentDispersal_StartingLow')
-  ICs = blackwood_mumby.X1
-  # blackwood_mumby.scenario_plot(t, BM_fishing_midpoint, ICs, filename = '12patchSeptember28_Apr25_BM_12patch_ScenarioPlot_98Dispersal_StartingLow')
-  ICs = blackwood_mumby.X2
-  # blackwood_mumby.scenario_plot(t, BM_fishing_midpoint, ICs, filename = '12patchSeptember28_Apr25_BM_12patch_ScenarioPlot_98Dispersal_StartingHigh')
+  for ic, suffix, leg in (('X1', 'StartingLow', False), ('X2', 'StartingHigh', True)):
+    sep_tasks.append(('vdL', 12, 0.95, 1, yrs, vdl_fishing_midpoint, ic, vdl_ics, 'September28_vdL_12patch_PoachingScenarioPlot_FivePercentDispersal_' + suffix, leg, 0.2))
+    sep_tasks.append(('RB', 12, 0.95, 1, RB_yrs*RB_crt, RB_fishing_midpoint, ic, (P0_RB, C0L, 0.6, M0vL, M0vH, M0iL, M0iH), 'September28_fixedRB_12patch_PoachingScenarioPlot_FivePercentDispersal_' + suffix, False, 0.2))
+    sep_tasks.append(('BM', 12, 0.95, 1, yrs, BM_fishing_midpoint, ic, vdl_ics, 'September28_BM_12patch_PoachingScenarioPlot_FivePercentDispersal_' + suffix, False, 0.2))
   
+  for ic, suffix in (('X1', 'StartingLow'), ('X2', 'StartingHigh')):
+    sep_tasks.append(('BM', 10, 1, 1, yrs, BM_fishing_midpoint, ic, (P0 + 0.1, C0L, C0H + 0.2, M0L-0.02, M0H), '12patchSeptember28_BM_ScenarioPlot_ZeroDispersal_' + suffix, False, 0))
+    sep_tasks.append(('vdL', 10, 1, 1, yrs, vdl_fishing_midpoint, ic, vdl_ics, '12patchSeptember28_vdL_ScenarioPlot_ZeroDispersal_' + suffix, False, 0))
 
- 
-
-  # create Model objects
-  
-  
-  blackwood_mumby = Model('BM', 10, 1, mgmt_strat = 'periodic') 
-  van_de_leemput = Model('vdL', 10, 1, mgmt_strat = 'periodic')
-  rass_briggs = Model('RB', 10, 1, mgmt_strat = 'periodic')
-  
-  
-  
-  blackwood_mumby.initialize_patch_model(P0 + 0.1, C0L, C0H + 0.2, M0L-0.02, M0H)
-  van_de_leemput.initialize_patch_model(P0, C0L, C0H, M0L, M0H)
-  rass_briggs.initialize_patch_model(P0, C0L, C0H, M0vL, M0vH, M0iL, M0iH)
-  
-  van_de_leemput.load_parameters()
-  rass_briggs.load_parameters()
-  blackwood_mumby.load_parameters()
-  
-
-  
-  ICs = rass_briggs.X2
-  #rass_briggs.scenario_plot(RB_t, RB_fishing_midpoint, ICs, filename = '12patchSeptember28_fixedRB_ScenarioPlot_ZeroDispersal_StartingHigh')
-  ICs = rass_briggs.X1
-  #rass_briggs.scenario_plot(RB_t, RB_fishing_midpoint, ICs, filename = '12patchSeptember28_fixedRB_ScenarioPlot_ZeroDispersal_StartingLow')
-  ICs = blackwood_mumby.X1
-  blackwood_mumby.scenario_plot(t, BM_fishing_midpoint, ICs, filename = '12patchSeptember28_BM_ScenarioPlot_ZeroDispersal_StartingLow')
-  ICs = blackwood_mumby.X2
-  blackwood_mumby.scenario_plot(t, BM_fishing_midpoint, ICs, filename = '12patchSeptember28_BM_ScenarioPlot_ZeroDispersal_StartingHigh')
-  ICs = van_de_leemput.X1
-  van_de_leemput.scenario_plot(t, vdl_fishing_midpoint, ICs, filename = '12patchSeptember28_vdL_ScenarioPlot_ZeroDispersal_StartingLow')
-  ICs = van_de_leemput.X2
-  van_de_leemput.scenario_plot(t, vdl_fishing_midpoint, ICs, filename = '12patchSeptember28_vdL_ScenarioPlot_ZeroDispersal_StartingHigh')
+  Parallel(n_jobs = -1, backend = 'loky')(delayed(run_scenario)(task) for task in sep_tasks)
   
   
   # 95 percent do not disperse
@@ -1760,22 +1765,8 @@ def main():
   van_de_leemput.initialize_patch_model(P0, C0L, C0H, M0L, M0H)
   rass_briggs.initialize_patch_model(P0, C0L, C0H + 0.2, M0vL, M0vH, M0iL, M0iH)
   
-  van_de_leemput.load_parameters()
-  rass_briggs.load_parameters()
-  blackwood_mumby.load_parameters()
-  
-  
-   
-  # blackwood_mumby.coral_recovery_map(RB_t, BM_fishing_midpoint, blackwood_mumby.X1, filename = '12patchSeptember28_BM_HEATMAP_LO5')
-  # blackwood_mumby.coral_recovery_map(RB_t, BM_fishing_midpoint, blackwood_mumby.X2, filename = '12patchSeptember28_BM_HEATMAP_HI5')
-  #  van_de_leemput.coral_recovery_map(RB_t, vdl_fishing_midpoint, van_de_leemput.X1, filename = '12patchSeptember28_VDL_HEATMAP_LO5')
-  # rass_briggs.coral_recovery_map(RB_t, RB_fishing_midpoint, rass_briggs.X1, filename = '12patchSeptember28_RB_HEATMAP_LO5')
-  # van_de_leemput.coral_recovery_map(RB_t, vdl_fishing_midpoint, van_de_leemput.X2, filename = '12patchSeptember28_VDL_HEATMAP_HI5')
-  # rass_briggs.coral_recovery_map(RB_t, RB_fishing_midpoint, rass_briggs.X2, filename = '12patchSeptember28_RB_HEATMAP_HI5')
-  # blackwood_mumby.coral_recovery_map(RB_t, BM_fishing_midpoint, blackwood_mumby.X1, filename = '12patchSeptember28_BM_HEATMAP_LO5')
-  # blackwood_mumby.coral_recovery_map(RB_t, BM_fishing_midpoint, blackwood_mumby.X2, filename = '12patchSeptember28_BM_HEATMAP_HI5')
-  
-  
+  for mdl in (van_de_leemput, rass_briggs, blackwood_mumby):
+    mdl.load_parameters()
 
 
   # coral recovery times for each model
@@ -1787,38 +1778,15 @@ def main():
   BM_crt = blackwood_mumby.get_coral_recovery_time(t)
 
 
-
   # make some time series -- X1 is starting low, X2 is starting high 
-  # blackwood_mumby.set_mgmt_params(BM_crt, BM_fishing_midpoint, 2, 0) # set closure duration, fishing level, number of closures, and poaching, in that order 
- #  blackwood_mumby.time_series(blackwood_mumby.X2, t, save = False, show = True) 
-  
-  # rass_briggs.set_mgmt_params(1*RB_crt, RB_fishing_midpoint, 0, 0)
-  # rass_briggs.time_series(rass_briggs.X2, t, save = False, show = True) 
-  
-  # van_de_leemput.set_mgmt_params(0.1*vdL_crt, vdl_fishing_midpoint, 2, 0)
-  # van_de_leemput.time_series(van_de_leemput.X2, t, save = False, show = True) 
 
-  
-  
-  
+
   # scenario plots 
   
-  ICs = blackwood_mumby.X1
-  # blackwood_mumby.scenario_plot(t, BM_fishing_midpoint, ICs, filename = '12patchSeptember28_NewBM_ScenarioPlot_1PercentDispersal_StartingLow')
   ICs = blackwood_mumby.X2
   blackwood_mumby.scenario_plot(t, BM_fishing_midpoint, ICs, filename = '12patchSeptember28_NewBM_ScenarioPlot_7PercentDispersal_StartingHigh')
-  # ICs = van_de_leemput.X1
-  # van_de_leemput.scenario_plot(t, vdl_fishing_midpoint, ICs, filename = '12patchSeptember28_NewvdL_ScenarioPlot_1PercentDispersal_StartingLow')
-  # ICs = van_de_leemput.X2
-  # van_de_leemput.scenario_plot(t, vdl_fishing_midpoint, ICs, filename = '12patchSeptember28_NewvdL_ScenarioPlot_1PercentDispersal_StartingHigh')
-  ICs = rass_briggs.X1
-  #rass_briggs.scenario_plot(RB_t, RB_fishing_midpoint, ICs, filename = '12patchSeptember28_fixedRB_ScenarioPlot_1PercentDispersal_StartingLow')
-  ICs = rass_briggs.X2
-  #rass_briggs.scenario_plot(RB_t, RB_fishing_midpoint, ICs, filename = '12patchSeptember28_fixedRB_ScenarioPlot_FivePercentDispersal_StartingHigh')
-  
-  
-  
-  
+
+
   # scenario plots with poaching 
   van_de_leemput.set_mgmt_params(closure_length = 35, f = 0, m = 1, poaching =  0.2)
   blackwood_mumby.set_mgmt_params(closure_length = 35, f = 0, m = 1, poaching =  0.2)
@@ -1828,14 +1796,6 @@ def main():
   blackwood_mumby.scenario_plot(t, BM_fishing_midpoint, ICs, filename = '12patchSeptember28_5BM_ScenarioPlot_0.1Dispersal_StartingLow_Poaching')
   ICs = blackwood_mumby.X2
   blackwood_mumby.scenario_plot(t, BM_fishing_midpoint, ICs, filename = '12patchSeptember28_5BM_ScenarioPlot_0.1Dispersal_StartingHigh_Poaching')
-  ICs = van_de_leemput.X1
-  # van_de_leemput.scenario_plot(t, vdl_fishing_midpoint, ICs, filename = '12patchSeptember28_5vdL_ScenarioPlot_0.1Dispersal_StartingLow_Poaching')
-  ICs = van_de_leemput.X2
-  # van_de_leemput.scenario_plot(t, vdl_fishing_midpoint, ICs, filename = '12patchSeptember28_5vdL_ScenarioPlot_0.1Dispersal_StartingHigh_Poaching')
-  ICs = rass_briggs.X1
-  #rass_briggs.scenario_plot(RB_t, RB_fishing_midpoint, ICs, filename = '12patchSeptember28_fixedRB_ScenarioPlot_0.1Dispersal_StartingLow_Poaching')
-  ICs = rass_briggs.X2
-  #rass_briggs.scenario_plot(RB_t, RB_fishing_midpoint, ICs, filename = '12patchSeptember28_fixedRB_ScenarioPlot_0.1Dispersal_StartingHigh_Poaching')
   
   
   # scenario plots for dispersal -- need to initialize new objects due to code structure 
@@ -1847,30 +1807,17 @@ def main():
   van_de_leemput.initialize_patch_model(P0, C0L, C0H, M0L, M0H)
   rass_briggs.initialize_patch_model(P0, C0L, C0H, M0vL, M0vH, M0iL, M0iH)
   
-  van_de_leemput.load_parameters()
-  rass_briggs.load_parameters()
-  blackwood_mumby.load_parameters()
-  
-  
-  
+  for mdl in (van_de_leemput, rass_briggs, blackwood_mumby):
+    mdl.load_parameters()
+
+
   # scenario plots for 20 percent of fish moving 
   
-  ICs = blackwood_mumby.X1
-  # blackwood_mumby.scenario_plot(t, BM_fishing_midpoint, ICs, filename = '12patchSeptember28_5BM_ScenarioPlot_0.2Dispersal_StartingLow')
   ICs = blackwood_mumby.X2
   blackwood_mumby.scenario_plot(t, BM_fishing_midpoint, ICs, filename = '12patchSeptember28_5BM_ScenarioPlot_0.2Dispersal_StartingHigh')
-  # ICs = van_de_leemput.X1
-  # van_de_leemput.scenario_plot(t, vdl_fishing_midpoint, ICs, filename = '12patchSeptember28_4vdL_ScenarioPlot_0.2Dispersal_StartingLow')
-  # ICs = van_de_leemput.X2
-  # van_de_leemput.scenario_plot(t, vdl_fishing_midpoint, ICs, filename = '12patchSeptember28_5vdL_ScenarioPlot_0.2Dispersal_StartingHigh')
-  
-  ICs = rass_briggs.X1
-  # #rass_briggs.scenario_plot(RB_t, RB_fishing_midpoint, ICs, filename = '12patchSeptember28_4RB_ScenarioPlot_0.2Dispersal_StartingLow')
-  
-  ICs = rass_briggs.X2
- #  #rass_briggs.scenario_plot(RB_t, RB_fishing_midpoint, ICs, filename = '12patchSeptember28_5RB_ScenarioPlot_0.2Dispersal_StartingHigh')
-  
   
+
+
   # for 50 percent of fish moving 
   
   blackwood_mumby = Model('BM', 30, 0.5, mgmt_strat = 'periodic') 
@@ -1881,23 +1828,12 @@ def main():
   van_de_leemput.initialize_patch_model(P0, C0L, C0H, M0L, M0H)
   rass_briggs.initialize_patch_model(P0, C0L, C0H, M0vL, M0vH, M0iL, M0iH)
   
-  van_de_leemput.load_parameters()
-  rass_briggs.load_parameters()
-  blackwood_mumby.load_parameters()
+  for mdl in (van_de_leemput, rass_briggs, blackwood_mumby):
+    mdl.load_parameters()
   
   
-  ICs = blackwood_mumby.X1
-  # blackwood_mumby.scenario_plot(t, BM_fishing_midpoint, ICs, filename = '12patchSeptember28_4BM_ScenarioPlot_FiftyPercentDispersal_StartingLow')
   ICs = blackwood_mumby.X2
   blackwood_mumby.scenario_plot(t, BM_fishing_midpoint, ICs, filename = '12patchSeptember28_5BM_ScenarioPlot_FiftyPercentDispersal_StartingHigh')
-  ICs = van_de_leemput.X1
-  # van_de_leemput.scenario_plot(t, vdl_fishing_midpoint, ICs, filename = '12patchSeptember28_4vdL_ScenarioPlot_FiftyPercentDispersal_StartingLow')
-  ICs = van_de_leemput.X2
- # van_de_leemput.scenario_plot(t, vdl_fishing_midpoint, ICs, filename = '12patchSeptember28_5vdL_ScenarioPlot_FiftyPercentDispersal_StartingHigh')
-  ICs = rass_briggs.X1
-  # #rass_briggs.scenario_plot(RB_t, RB_fishing_midpoint, ICs, filename = '12patchSeptember28_4RB_ScenarioPlot_FiftyPercentDispersal_StartingLow')
-  ICs = rass_briggs.X2
-  # #rass_briggs.scenario_plot(RB_t, RB_fishing_midpoint, ICs, filename = '12patchSeptember28_5RB_ScenarioPlot_FiftyPercentDispersal_StartingHigh')
   
 
   # 95 percent do not disperse
@@ -1909,19 +1845,14 @@ def main():
   van_de_leemput.initialize_patch_model(P0, C0L, C0H, M0L, M0H)
   rass_briggs.initialize_patch_model(P0, C0L, C0H, M0vL, M0vH, M0iL, M0iH)
   
-  van_de_leemput.load_parameters()
-  rass_briggs.load_parameters()
-  blackwood_mumby.load_parameters()
+  for mdl in (van_de_leemput, rass_briggs, blackwood_mumby):
+    mdl.load_parameters()
   
  
   quit()
-  
 
 
 if __name__ == '__main__':
 	main()
 
 
-
-
-